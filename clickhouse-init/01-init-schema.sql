@@ -112,6 +112,61 @@ CREATE TABLE IF NOT EXISTS solana_transactions (
 ORDER BY (timestamp, slot)
 PARTITION BY toYYYYMM(timestamp);
 
+-- ========================================
+-- Record Counts (incrementally maintained)
+-- ========================================
+-- Each materialized view below runs on every INSERT into its source table and
+-- writes one row (source, number of rows inserted) into record_counts.
+-- SummingMergeTree adds up rows with the same source as parts merge, so the
+-- table stays at a handful of rows no matter how much data is collected.
+-- Reading the counts is then a tiny read instead of a count over the data.
+-- Rows not yet merged may still be separate, so always read with sum():
+--   SELECT source, sum(total) FROM record_counts GROUP BY source
+--
+-- The views only see rows inserted after they are created. The backfill below
+-- first seeds record_counts with each table's existing row count. It skips any
+-- source that already has counts, so re-running this script does not double
+-- count. Docker only runs this script on an empty data directory. On an
+-- existing deployment, stop the collector and run it once by hand (see the
+-- record_counts section of README.md).
+CREATE TABLE IF NOT EXISTS record_counts (
+    source String,
+    total UInt64
+) ENGINE = SummingMergeTree()
+ORDER BY source;
+
+INSERT INTO record_counts
+SELECT 'bitcoin_blocks' AS source, count() AS total FROM bitcoin_blocks
+WHERE 'bitcoin_blocks' NOT IN (SELECT source FROM record_counts)
+HAVING total > 0;
+
+INSERT INTO record_counts
+SELECT 'bitcoin_transactions' AS source, count() AS total FROM bitcoin_transactions
+WHERE 'bitcoin_transactions' NOT IN (SELECT source FROM record_counts)
+HAVING total > 0;
+
+INSERT INTO record_counts
+SELECT 'solana_blocks' AS source, count() AS total FROM solana_blocks
+WHERE 'solana_blocks' NOT IN (SELECT source FROM record_counts)
+HAVING total > 0;
+
+INSERT INTO record_counts
+SELECT 'solana_transactions' AS source, count() AS total FROM solana_transactions
+WHERE 'solana_transactions' NOT IN (SELECT source FROM record_counts)
+HAVING total > 0;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS bitcoin_blocks_counts_mv TO record_counts AS
+SELECT 'bitcoin_blocks' AS source, count() AS total FROM bitcoin_blocks;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS bitcoin_transactions_counts_mv TO record_counts AS
+SELECT 'bitcoin_transactions' AS source, count() AS total FROM bitcoin_transactions;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS solana_blocks_counts_mv TO record_counts AS
+SELECT 'solana_blocks' AS source, count() AS total FROM solana_blocks;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS solana_transactions_counts_mv TO record_counts AS
+SELECT 'solana_transactions' AS source, count() AS total FROM solana_transactions;
+
 -- Collection Metrics Table (for monitoring)
 CREATE TABLE IF NOT EXISTS collection_metrics (
     metric_time DateTime CODEC(Delta, ZSTD(3)),
@@ -50,15 +50,42 @@ $3 change. Similarly, Bitcoin transactions consume existing UTXOs (inputs) and c
 new UTXOs (outputs).
 """
 
+import functools
+import itertools
 import logging
+import os
+from operator import itemgetter
+import time
 from datetime import datetime
+from urllib.parse import urlparse
 import aiohttp
 import asyncio
+import cachetools
+import orjson
 
-from .data_validator import DataValidator, log_quality_issue
+from .data_validator import (
+    ASYNC_INSERT_SETTINGS, METRICS_COLUMNS, METRICS_COLUMN_TYPES, DataValidator, log_quality_issue
+)
 
 logger = logging.getLogger(__name__)
 
+# Bitcoin rows are buffered as tuples in these column orders and written
+# together by flush(), which passes the types to skip a DESCRIBE per insert
+BITCOIN_BLOCK_COLUMNS = ('block_height', 'block_hash', 'timestamp', 'previous_block_hash',
+                         'merkle_root', 'difficulty', 'nonce', 'size', 'weight', 'transaction_count')
+BITCOIN_BLOCK_COLUMN_TYPES = ('UInt64', 'String', 'DateTime', 'String',
+                              'String', 'UInt64', 'UInt64', 'UInt32', 'UInt32', 'UInt32')
+BITCOIN_TX_COLUMNS = ('tx_hash', 'block_height', 'block_hash', 'size',
+                      'weight', 'fee', 'input_count', 'output_count', 'timestamp')
+BITCOIN_TX_COLUMN_TYPES = ('String', 'UInt64', 'String', 'UInt32',
+                           'UInt32', 'UInt64', 'UInt32', 'UInt32', 'DateTime')
+_bitcoin_block_row = itemgetter(*BITCOIN_BLOCK_COLUMNS)
+
+# Blocks this far below the tip are treated as final: a reorg deeper than six
+# blocks is practically unheard of, so only their height -> hash answers are
+# kept in the long-lived cache
+SAFE_CONFIRMATIONS = 6
+
 
 class BitcoinCollector:
     """
@@ -68,6 +95,13 @@ class BitcoinCollector:
     where miners compete to find a valid block hash by adjusting the nonce.
     """
 
+    # Maximum number of per-transaction requests scheduled at once
+    TX_FETCH_BATCH_SIZE = 500
+    # Transactions returned per page by Esplora's /block/{hash}/txs/{start_index}
+    TXS_PAGE_SIZE = 25
+    # Per-request timeout; immutable, so one instance serves every request
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
     def __init__(self, rpc_url: str, enabled: bool = True):
         """
         Initialize the Bitcoin collector.
@@ -89,12 +123,153 @@ class BitcoinCollector:
         self.enabled = enabled
         # Track last processed block to collect sequentially
         self.last_block_height = None
-        # Retry and backoff state for resilient API calls
-        self.retry_delay = 1  # Start with 1 second
+        # Retry and backoff state for resilient API calls, kept per host
+        # (netloc) so one rate-limited endpoint does not slow down the others
+        self.retry_delays = {}  # Each host starts at 1 second
         self.max_retry_delay = 300  # Max 5 minutes
+        # time.monotonic() of the last successful collection; monotonic time is
+        # cheaper than datetime.now() and immune to wall-clock (NTP) adjustments
         self.last_successful_collect = None
         # Initialize data validator for quality checks
         self.validator = DataValidator()
+        # HTTP session shared across collection cycles (created lazily)
+        self._session = None
+        # Cap on in-flight HTTP requests across all concurrent fetches
+        self._request_sem = asyncio.Semaphore(int(os.getenv('BITCOIN_MAX_CONCURRENT', '16')))
+        # Token bucket shared by all coroutines: refills at BITCOIN_MAX_REQUESTS_PER_SECOND
+        # tokens per second and holds at most one second's worth (0, the default, disables it)
+        self.max_requests_per_second = float(os.getenv('BITCOIN_MAX_REQUESTS_PER_SECOND', '0'))
+        self._rate_tokens = self.max_requests_per_second
+        self._rate_updated_at = time.monotonic()
+        self._rate_lock = asyncio.Lock()
+        # Most recently fetched chain tip as (height, time.monotonic() timestamp)
+        self._tip_cache = None
+        self.tip_ttl_seconds = float(os.getenv('BITCOIN_TIP_TTL_SECONDS', '30'))
+        # Transactions sampled per block (0 = all); read once, not per block
+        self.tx_limit = int(os.getenv('BITCOIN_TX_LIMIT', '25'))
+        # Recently fetched API responses keyed by (url, return_type), so retries
+        # and re-collection after a partial failure don't refetch the same data.
+        # A block's hash stops changing once it is buried under enough
+        # confirmations, so those height -> hash lookups are kept much longer
+        # than other responses.
+        self._url_cache = cachetools.TTLCache(maxsize=2048, ttl=300)
+        self._block_hash_cache = cachetools.TTLCache(maxsize=1024, ttl=6 * 3600)
+        # A txid is the hash of the transaction itself, so /tx/{txid} responses
+        # never go stale: they are kept until evicted by size, not by age
+        self._tx_cache = cachetools.LRUCache(maxsize=4096)
+        # Rows of collected blocks waiting to be written in one large batch.
+        # last_block_height only advances once a flush succeeds; the height of
+        # the newest buffered block is tracked separately in _buffered_height.
+        self._block_buffer = []
+        self._tx_buffer = []
+        self._buffered_height = None
+        self._last_flush = time.monotonic()
+        self.flush_rows = int(os.getenv('BITCOIN_FLUSH_ROWS', '10000'))
+        self.flush_interval_seconds = float(os.getenv('BITCOIN_FLUSH_INTERVAL_SECONDS', '30'))
+
+    async def _ensure_session(self):
+        """
+        Return the collector's shared aiohttp session, creating it on first use.
+
+        EDUCATIONAL NOTE - Connection Reuse:
+        Opening a new ClientSession per collection cycle tears down every TCP
+        and TLS connection when the cycle ends, so the next poll pays the full
+        handshake again (~150ms to Blockstream over HTTPS). A long-lived session
+        keeps idle connections in the connector's pool for reuse. The keep-alive
+        timeout matches nginx's 75 second default, and DNS results are cached
+        for 5 minutes. force_close is pinned to False so the dependent request
+        chain of a block (tip -> hash -> header) runs over one warm connection.
+
+        Returns:
+            aiohttp ClientSession
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                force_close=False,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session and release its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _acquire_rate_token(self):
+        """
+        Wait until the shared token bucket allows another API request.
+
+        EDUCATIONAL NOTE - Token Bucket Rate Limiting:
+        The bucket refills continuously at the configured rate and each request
+        spends one token, allowing short bursts while holding the long-run
+        average to the limit. The lock makes coroutines take tokens one at a
+        time: without it, concurrent fetches would all read the same state,
+        all decide to wait (or not) together, and then stampede the API at once.
+        """
+        rate = self.max_requests_per_second
+        if rate <= 0:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            self._rate_tokens = min(rate, self._rate_tokens + (now - self._rate_updated_at) * rate)
+            self._rate_updated_at = now
+            if self._rate_tokens < 1:
+                await asyncio.sleep((1 - self._rate_tokens) / rate)
+                self._rate_tokens = 1
+                self._rate_updated_at = time.monotonic()
+            self._rate_tokens -= 1
+
+    async def _insert(self, client, table, data, **kwargs):
+        """
+        Run a ClickHouse insert in the default thread pool executor.
+
+        EDUCATIONAL NOTE - Blocking Calls in Async Code:
+        clickhouse-connect is a synchronous library, so calling client.insert()
+        directly would freeze the event loop until ClickHouse answers - stalling
+        every other coroutine (including the Solana collector's API calls)
+        for the duration of the write. run_in_executor() hands the call to a
+        worker thread and lets the loop keep serving network I/O meanwhile.
+
+        Args:
+            client: ClickHouse client
+            table: Target table name
+            data: Rows to insert
+            **kwargs: Extra arguments for client.insert() (e.g. column_names)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(client.insert, table, data, **kwargs))
+
+    def _response_cache_for(self, url):
+        """Return the response cache for a URL, or None if it must not be cached."""
+        if '/blocks/tip/' in url or url.endswith('/blocks'):
+            return None  # The chain tip changes; see _get_tip_height()
+        if '/block-height/' in url:
+            # A block near the tip can still be replaced by a reorg, so its
+            # hash only gets the short TTL until it is SAFE_CONFIRMATIONS deep
+            height = int(url.rsplit('/', 1)[1])
+            if self._tip_cache is not None and height <= self._tip_cache[0] - SAFE_CONFIRMATIONS:
+                return self._block_hash_cache
+            return self._url_cache
+        if '/tx/' in url:
+            return self._tx_cache
+        return self._url_cache
+
+    def _cache_response(self, url, return_type, result):
+        """
+        Store a response where _api_call_with_retry() will look for it.
+
+        Entries are keyed by (url, return_type), so callers seeding the cache
+        with data obtained another way must go through here to use the same key.
+        """
+        cache = self._response_cache_for(url)
+        if cache is not None:
+            cache[(url, return_type)] = result
 
     async def _api_call_with_retry(self, session, url, max_retries=3, return_type='json'):
         """
@@ -103,7 +278,20 @@ class BitcoinCollector:
         EDUCATIONAL NOTE - Resilient API Calls:
         Public APIs can fail for many reasons: rate limits, network issues, temporary
         outages. Exponential backoff (1s, 2s, 4s, 8s...) prevents overwhelming the
-        server while allowing recovery from transient failures.
+        server while allowing recovery from transient failures. The rate-limit
+        backoff is tracked separately for each host, so a 429 from one endpoint
+        does not throttle requests to a healthy one.
+
+        EDUCATIONAL NOTE - Bounded Concurrency:
+        Batched transaction fetches can schedule hundreds of requests at once.
+        Every request first acquires a slot from a shared semaphore, so at most
+        BITCOIN_MAX_CONCURRENT requests are in flight no matter how many are
+        gathered. This avoids provoking 429 responses in the first place rather
+        than only reacting to them.
+
+        Successful responses are kept in a short-lived cache, so fetching the
+        same URL again (e.g. re-collecting a block after a partial failure)
+        returns immediately without another request.
 
         Args:
             session: aiohttp ClientSession
@@ -117,38 +305,63 @@ class BitcoinCollector:
         Raises:
             Exception: After all retries exhausted
         """
+        cache = self._response_cache_for(url)
+        cache_key = (url, return_type)
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Backoff state is looked up for this request's host only
+        host = urlparse(url).netloc
+
         for attempt in range(max_retries):
+            retry_delay = self.retry_delays.get(host, 1)
             try:
-                timeout = aiohttp.ClientTimeout(total=10)
-                async with session.get(url, timeout=timeout) as resp:
-                    # Check for rate limiting
-                    if resp.status == 429:
-                        retry_after = int(resp.headers.get('Retry-After', self.retry_delay))
-                        logger.warning(f"Rate limited by Blockstream API, waiting {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        self.retry_delay = min(self.retry_delay * 2, self.max_retry_delay)
-                        continue
-
-                    # Check for "block not found" (404) - not an error, just no new block yet
-                    if resp.status == 404:
-                        logger.info("Bitcoin block not found - waiting for next block to be mined")
-                        return None
-
-                    # Check for other HTTP errors
-                    if resp.status >= 400:
-                        error_text = await resp.text()
-                        logger.warning(f"HTTP {resp.status} error on {url}: {error_text[:100]}")
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(2 ** attempt)
-                            continue
-                        else:
-                            raise Exception(f"HTTP {resp.status}: {error_text[:100]}")
+                await self._acquire_rate_token()
+                async with self._request_sem:
+                    async with session.get(url, timeout=self.REQUEST_TIMEOUT) as resp:
+                        # Check for rate limiting
+                        if resp.status == 429:
+                            wait = int(resp.headers.get('Retry-After', retry_delay))
+                            logger.warning(f"Rate limited by Blockstream API, waiting {wait}s")
+                            self.retry_delays[host] = min(retry_delay * 2, self.max_retry_delay)
+
+                        # Check for "block not found" (404) - not an error, just no new block yet
+                        elif resp.status == 404:
+                            logger.info("Bitcoin block not found - waiting for next block to be mined")
+                            return None
+
+                        # Check for other HTTP errors
+                        elif resp.status >= 400:
+                            # Only a short prefix of the body is logged, so only that
+                            # much is read: a misbehaving proxy's multi-MB error page
+                            # is never buffered just to be truncated
+                            error_text = (await resp.content.read(256)).decode('utf-8', errors='replace')[:100]
+                            logger.warning(f"HTTP {resp.status} error on {url}: {error_text}")
+                            if attempt == max_retries - 1:
+                                raise Exception(f"HTTP {resp.status}: {error_text}")
+                            wait = 2 ** attempt
 
-                    # Success - parse response
-                    if return_type == 'json':
-                        return await resp.json()
-                    else:
-                        return await resp.text()
+                        else:
+                            # Success - parse response. orjson decodes the raw bytes
+                            # directly, 2-3x faster than the stdlib json module that
+                            # resp.json() uses, with less intermediate garbage.
+                            if return_type == 'json':
+                                result = orjson.loads(await resp.read())
+                            else:
+                                result = await resp.text()
+                            # Reduce this host's retry delay on success
+                            if retry_delay > 1:
+                                self.retry_delays[host] = max(1, retry_delay // 2)
+                            self._cache_response(url, return_type, result)
+                            return result
+
+                # Wait before retrying only after the response and the semaphore
+                # slot have been released: a long Retry-After must not hold a
+                # pooled connection or keep other requests out of the slot
+                await asyncio.sleep(wait)
+                continue
 
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout on {url}, attempt {attempt + 1}/{max_retries}")
@@ -163,6 +376,465 @@ class BitcoinCollector:
 
         raise Exception(f"Failed to fetch {url} after {max_retries} attempts")
 
+    def _collected_height(self):
+        """Return the height of the newest collected block, buffered or written."""
+        if self._buffered_height is not None:
+            return self._buffered_height
+        return self.last_block_height
+
+    async def flush(self, client):
+        """
+        Write all buffered block and transaction rows to ClickHouse.
+
+        EDUCATIONAL NOTE - Insert Batching:
+        Every ClickHouse insert creates a new data part on disk that background
+        merges must later combine, and pays a full HTTP round-trip. Writing one
+        block of 25 transactions at a time makes thousands of tiny parts;
+        ClickHouse recommends batches of 10,000-100,000 rows. Rows from many
+        blocks are therefore buffered and written together once the buffer
+        holds BITCOIN_FLUSH_ROWS transactions or BITCOIN_FLUSH_INTERVAL_SECONDS
+        have passed since the last flush - trading a little freshness for far
+        fewer, larger inserts.
+
+        Each buffer is cleared as soon as its table has been written, so a
+        failed transaction insert is retried later without re-inserting blocks.
+
+        EDUCATIONAL NOTE - Explicit Column Types:
+        Given only column names, clickhouse-connect first runs DESCRIBE TABLE
+        to learn how to serialize each column - a full extra round-trip before
+        every insert. Passing the ClickHouse type names (matching the schema
+        in clickhouse-init) lets it encode the rows straight away.
+
+        Args:
+            client: ClickHouse client
+
+        Returns:
+            Number of rows written
+        """
+        records_written = 0
+        if self._block_buffer:
+            await self._insert(client, 'bitcoin_blocks', self._block_buffer,
+                               column_names=BITCOIN_BLOCK_COLUMNS, column_type_names=BITCOIN_BLOCK_COLUMN_TYPES)
+            records_written += len(self._block_buffer)
+            self._block_buffer = []
+
+        if self._tx_buffer:
+            # Rows are already tuples in BITCOIN_TX_COLUMNS order
+            await self._insert(client, 'bitcoin_transactions', self._tx_buffer,
+                               column_names=BITCOIN_TX_COLUMNS, column_type_names=BITCOIN_TX_COLUMN_TYPES)
+            records_written += len(self._tx_buffer)
+            self._tx_buffer = []
+
+        if self._buffered_height is not None:
+            self.last_block_height = self._buffered_height
+            self._buffered_height = None
+        self._last_flush = time.monotonic()
+        return records_written
+
+    def _flush_due(self):
+        """Return True when the buffered rows should be written now."""
+        if not self._block_buffer and not self._tx_buffer:
+            return False
+        return (len(self._tx_buffer) >= self.flush_rows
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds)
+
+    async def _get_tip_height(self, session):
+        """
+        Return the current chain height, reusing a recent answer when possible.
+
+        EDUCATIONAL NOTE - TTL Caching:
+        Bitcoin produces a block roughly every 10 minutes, but we poll every few
+        seconds, so nearly every tip request returns the same
+        number. The tip is cached for BITCOIN_TIP_TTL_SECONDS: a new block is
+        noticed at most one TTL late, in exchange for skipping the round-trip
+        on almost every poll. While we are still behind the cached tip there
+        is known work to do, so the cache is used regardless of its age.
+
+        Args:
+            session: aiohttp ClientSession
+
+        Returns:
+            Chain tip height, or None if the API is temporarily unavailable
+        """
+        if self._tip_cache is not None:
+            cached_height, fetched_at = self._tip_cache
+            collected_height = self._collected_height()
+            behind_tip = collected_height is not None and collected_height < cached_height
+            if behind_tip or time.monotonic() - fetched_at < self.tip_ttl_seconds:
+                return cached_height
+
+        # EDUCATIONAL NOTE - Piggybacking on the Tip Check:
+        # /blocks returns the 10 most recent blocks with full metadata, newest
+        # first, in the same format as /block/{hash}. One request tells us the
+        # tip height AND the hash and header of every block near the tip, so
+        # the usual next block needs neither a /block-height/{h} nor a
+        # /block/{hash} round-trip: both answers are seeded into the caches
+        # that _api_call_with_retry() already consults.
+        recent_blocks = await self._api_call_with_retry(
+            session, f"{self.rpc_url}/blocks", return_type='json'
+        )
+        if not recent_blocks:
+            return None
+        latest_height = recent_blocks[0]['height']
+        # Set before seeding, so each block's depth is judged against this tip
+        self._tip_cache = (latest_height, time.monotonic())
+        for block in recent_blocks:
+            # Same URLs and return types that _collect_block() and
+            # _fetch_block_body() request, so their lookups hit these entries
+            self._cache_response(f"{self.rpc_url}/block-height/{block['height']}", 'text', block['id'])
+            self._cache_response(f"{self.rpc_url}/block/{block['id']}", 'json', block)
+        return latest_height
+
+    async def _fetch_block_body(self, session, block_hash):
+        """
+        Fetch a block's metadata and its first page of transactions concurrently.
+
+        EDUCATIONAL NOTE - Concurrent Independent Requests:
+        The Blockstream API's /block/{hash} endpoint returns block metadata only;
+        transactions come from /block/{hash}/txs/{start_index}. Both requests
+        depend only on the block hash, not on each other, so they are issued
+        together with asyncio.gather(): the pair costs one round-trip of latency
+        instead of two. Every block has at least its coinbase transaction, so
+        the first page always exists.
+
+        Args:
+            session: aiohttp ClientSession
+            block_hash: Hash of the block to fetch
+
+        Returns:
+            Tuple of (block metadata, first page of transactions). The block is
+            None if the API did not return it; the page is None if it failed.
+        """
+        block, first_page = await asyncio.gather(
+            self._api_call_with_retry(session, f"{self.rpc_url}/block/{block_hash}", return_type='json'),
+            self._api_call_with_retry(session, f"{self.rpc_url}/block/{block_hash}/txs/0", return_type='json'),
+            return_exceptions=True
+        )
+        if isinstance(block, Exception):
+            raise block
+        if isinstance(first_page, Exception):
+            logger.warning(f"Error fetching Bitcoin txs page 0 of block {block_hash}: {first_page}")
+            first_page = None
+        return block, first_page
+
+    async def _fetch_block_txs_bulk(self, session, block_hash, tx_count, first_page=None):
+        """
+        Fetch the first tx_count transactions of a block in pages of 25.
+
+        EDUCATIONAL NOTE - Bulk Endpoints:
+        Esplora's /block/{hash}/txs/{start_index} returns 25 full transaction
+        objects per call, in block order. Paging through it needs one request
+        per 25 transactions instead of one per transaction: the default sample
+        of 25 transactions becomes a single request. Pages are independent of
+        each other, so they are fetched concurrently.
+
+        The block's full txid list (/block/{hash}/txids, thousands of entries
+        for a busy block) is only downloaded if a page fails, to find which
+        transactions to fetch individually instead.
+
+        Args:
+            session: aiohttp ClientSession
+            block_hash: Hash of the block whose transactions to fetch
+            tx_count: Number of transactions needed from the start of the block
+            first_page: Already fetched page starting at index 0, if any
+
+        Returns:
+            List of up to tx_count transaction objects in block order.
+            Transactions that could not be fetched at all are omitted.
+        """
+        # One slot per page, indexed by page number; None marks a page not fetched yet
+        page_count = -(-tx_count // self.TXS_PAGE_SIZE)
+        pages = [None] * page_count
+        if page_count and first_page is not None:
+            pages[0] = first_page
+        remaining = [i for i in range(page_count) if pages[i] is None]
+        results = await asyncio.gather(
+            *(self._api_call_with_retry(
+                session, f"{self.rpc_url}/block/{block_hash}/txs/{i * self.TXS_PAGE_SIZE}", return_type='json'
+              ) for i in remaining),
+            return_exceptions=True
+        )
+        for i, page in zip(remaining, results):
+            if isinstance(page, Exception):
+                logger.warning(
+                    f"Error fetching Bitcoin txs page {i * self.TXS_PAGE_SIZE} of block {block_hash}: {page}"
+                )
+            else:
+                pages[i] = page
+
+        failed = [i for i in range(page_count) if pages[i] is None]
+        if failed:
+            all_tx_ids = await self._api_call_with_retry(
+                session, f"{self.rpc_url}/block/{block_hash}/txids", return_type='json'
+            )
+            if all_tx_ids:
+                page_ids = {
+                    i: all_tx_ids[i * self.TXS_PAGE_SIZE:min((i + 1) * self.TXS_PAGE_SIZE, tx_count)]
+                    for i in failed
+                }
+                fetched = await self._fetch_transactions(
+                    session, [tx_id for ids in page_ids.values() for tx_id in ids]
+                )
+                for i, ids in page_ids.items():
+                    pages[i] = [fetched[tx_id] for tx_id in ids if tx_id in fetched]
+
+        txs = []
+        for page in pages:
+            if page is not None:
+                txs.extend(page)
+        return txs[:tx_count]
+
+    async def _fetch_transactions(self, session, tx_ids):
+        """
+        Fetch full transaction objects for a list of txids concurrently.
+
+        EDUCATIONAL NOTE - Batching Round-Trips:
+        Fetching transactions one at a time costs one full network round-trip
+        per txid, so 25 transactions take ~25x the latency of a single request.
+        Blockstream's REST API has no JSON-RPC style batch endpoint, so instead
+        we collect every txid up front and issue the requests concurrently.
+        At most TX_FETCH_BATCH_SIZE requests are scheduled at once so that an
+        unlimited collection of a 3000+ transaction block never holds
+        thousands of in-flight requests and responses in memory.
+
+        EDUCATIONAL NOTE - Avoiding Head-of-Line Blocking:
+        Waiting for a whole batch with asyncio.gather() before starting the
+        next one means a single slow response stalls every request behind it.
+        Instead this keeps a sliding window: each time a request completes,
+        its result is recorded and the next txid is scheduled in its place.
+
+        Args:
+            session: aiohttp ClientSession
+            tx_ids: List of transaction IDs to fetch
+
+        Returns:
+            Dict mapping txid to its transaction object. Transactions that
+            could not be fetched are logged and omitted.
+        """
+        txs = {}
+        pending = {}
+        remaining = iter(tx_ids)
+        try:
+            while True:
+                for tx_id in itertools.islice(remaining, self.TX_FETCH_BATCH_SIZE - len(pending)):
+                    task = asyncio.create_task(
+                        self._api_call_with_retry(session, f"{self.rpc_url}/tx/{tx_id}", return_type='json')
+                    )
+                    pending[task] = tx_id
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tx_id = pending.pop(task)
+                    if task.exception() is not None:
+                        logger.warning(f"Error fetching Bitcoin tx {tx_id}: {task.exception()}")
+                    elif task.result() is None:
+                        logger.warning(f"Could not fetch Bitcoin tx {tx_id}")
+                    else:
+                        txs[tx_id] = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        return txs
+
+    async def _collect_block(self, session, client, block_height):
+        """
+        Fetch, transform and validate one Bitcoin block and its transactions.
+
+        The block is fully assembled before anything is written, so the caller
+        can insert the block and transaction rows together (and batch them
+        with other blocks) rather than writing each table as data arrives.
+
+        Args:
+            session: aiohttp ClientSession
+            client: ClickHouse client, used to log data quality issues
+            block_height: Height of the block to collect
+
+        Returns:
+            Tuple of (block_data dict, list of transaction row tuples), or None if
+            the block is not available yet
+        """
+        # Bitcoin requires two API calls: first get hash, then get block
+        # This is because blocks are identified by hash, not height
+        block_hash = await self._api_call_with_retry(
+            session, f"{self.rpc_url}/block-height/{block_height}", return_type='text'
+        )
+        if block_hash is None:
+            return None  # Block not found yet (404) - waiting for next block to be mined
+
+        block, first_page = await self._fetch_block_body(session, block_hash)
+        if block is None:
+            return None  # Block not available
+
+        # Fields that are not guaranteed by every Esplora-compatible API fall back
+        # to a derived value (or Bitcoin Core's naming). The fallback is computed
+        # only when the field is missing, instead of eagerly on every block as a
+        # dict.get() default argument would be.
+        weight = block.get('weight')
+        if weight is None:
+            # weight = base size * 3 + total size (BIP 141)
+            weight = block.get('strippedsize', block['size']) * 3 + block['size']
+        merkle_root = block.get('merkle_root')
+        if merkle_root is None:
+            merkle_root = block['merkleroot']
+        block_tx_count = block.get('tx_count')
+        if block_tx_count is None:
+            block_tx_count = block['nTx']
+
+        # Limit to BITCOIN_TX_LIMIT transactions for educational purposes (explained below)
+        tx_count = min(self.tx_limit, block_tx_count) if self.tx_limit else block_tx_count
+
+        # EDUCATIONAL NOTE - Bitcoin Block Structure:
+        #
+        # block_height: Number of blocks since genesis (block 0). Also called
+        #               "block number" in other chains.
+        #
+        # previous_block_hash: Links to parent block, creating the blockchain.
+        #                      Genesis block has this set to all zeros.
+        #
+        # merkle_root: Root hash of a Merkle tree containing all transaction hashes.
+        #              This allows efficient verification that a transaction is in
+        #              a block without downloading all transactions (Simplified
+        #              Payment Verification / SPV). Changing ANY transaction
+        #              changes the merkle root.
+        #
+        # difficulty: A measure of how hard it is to find a valid block hash.
+        #             Adjusts every 2016 blocks to maintain ~10 minute block times.
+        #
+        # nonce: A 32-bit number miners increment to find a valid block hash.
+        #        A valid hash must be less than the target (derived from difficulty).
+        #        This is the "work" in Proof-of-Work: trial and error until valid.
+        #
+        # size: Block size in bytes. Bitcoin has a ~1MB base block size limit.
+        #
+        # weight: Replaced "size" as the limiting factor after SegWit upgrade.
+        #         Maximum weight is 4,000,000 units (allows ~1-4 MB of data).
+        #         SegWit transactions have lower weight, incentivizing adoption.
+        block_data = {
+            'block_height': block_height,
+            'block_hash': block['id'],
+            'timestamp': datetime.fromtimestamp(block['timestamp']),
+            'previous_block_hash': block['previousblockhash'],
+            'merkle_root': merkle_root,
+            'difficulty': int(block['difficulty']),
+            'nonce': block['nonce'],
+            'size': block['size'],
+            'weight': weight,
+            'transaction_count': block_tx_count
+        }
+
+        # ================================================================
+        # [VERACITY] Validate block data before insertion
+        # ================================================================
+        # This is a critical step in ensuring data quality. We check:
+        # - All required fields are present
+        # - Values are within expected ranges
+        # - Timestamp is reasonable
+        # - Hash formats are valid
+        block_validation = self.validator.validate_bitcoin_block(block_data)
+
+        if not block_validation.is_valid:
+            logger.warning(
+                f"[VERACITY] Bitcoin block {block_height} has quality issues: "
+                f"{block_validation.issues}"
+            )
+            # Log quality issue for tracking and analysis
+            log_quality_issue(
+                source='bitcoin',
+                record_type='block',
+                record_id=str(block_height),
+                result=block_validation,
+                client=client
+            )
+
+        if block_validation.warnings:
+            logger.info(
+                f"[VERACITY] Bitcoin block {block_height} warnings: "
+                f"{block_validation.warnings}"
+            )
+
+        # EDUCATIONAL NOTE - API Rate Limiting:
+        # We limit to 25 transactions per block by default (BITCOIN_TX_LIMIT)
+        # for several reasons:
+        # 1. API Rate Limits: Public APIs have request quotas
+        # 2. Educational Focus: 25 transactions provide sufficient data for learning
+        # 3. Performance: Bitcoin blocks can have 2000+ transactions
+        # 4. Cost: Some APIs charge per request
+        #
+        # In production systems, you would:
+        # - Use pagination to fetch all transactions
+        # - Implement exponential backoff for rate limit errors
+        # - Consider running your own Bitcoin node for unlimited access
+
+        # Fetch transactions in pages of 25 from the bulk endpoint; only the
+        # sampled transactions are kept, as a single list in block order
+        txs = await self._fetch_block_txs_bulk(session, block_hash, tx_count, first_page)
+        tx_data = []
+
+        # Values shared by every transaction in the block are computed once
+        # here rather than once per transaction inside the loop
+        block_id = block_data['block_hash']
+        block_timestamp = block_data['timestamp']
+
+        for tx in txs:
+            try:
+                # EDUCATIONAL NOTE - Bitcoin Transaction Structure (UTXO Model):
+                #
+                # Unlike Ethereum, Bitcoin transactions don't have a simple
+                # "from" address field. The sender is determined by which
+                # UTXOs (inputs) are being spent.
+                #
+                # vin (inputs): List of UTXOs being consumed (spent)
+                #               Each input references a previous transaction output
+                #
+                # vout (outputs): List of new UTXOs being created
+                #                 Each output has an amount and locking script
+                #
+                # input_count: Number of UTXOs being spent in this transaction
+                # output_count: Number of new UTXOs being created
+                #
+                # fee: Satoshis paid to miners = sum(input values) - sum(output values)
+                #      Higher fees = faster confirmation (miners prioritize profitable txs)
+                #      Fee is implicit, not a separate field in the transaction
+                #
+                # size: Transaction size in bytes (affects fee calculation)
+                # weight: SegWit-adjusted size for fee calculation
+                #
+                # Bitcoin's smallest unit: 1 Satoshi = 0.00000001 BTC (8 decimal places)
+                #
+                # Each row is built directly as a tuple in bitcoin_transactions
+                # column order, ready for insertion - no intermediate dict per
+                # transaction that would have to be unpacked again by key.
+                tx_row = (
+                    tx['txid'],
+                    block_height,
+                    block_id,
+                    tx['size'],
+                    tx['weight'],
+                    int(tx.get('fee', 0)),  # Fee in satoshis, convert to int for UInt64
+                    len(tx['vin']),
+                    len(tx['vout']),
+                    block_timestamp
+                )
+
+                tx_data.append(tx_row)
+            except Exception as e:
+                # Log but continue - don't let one bad transaction stop collection
+                logger.warning(f"Error collecting Bitcoin tx {tx.get('txid')}: {e}")
+                continue
+
+        # [VERACITY] Validate the block's transactions in one batch before insertion
+        tx_validations = self.validator.validate_bitcoin_transactions_batch(tx_data)
+        for tx_row, tx_validation in zip(tx_data, tx_validations):
+            if not tx_validation.is_valid:
+                logger.debug(
+                    f"[VERACITY] Bitcoin tx {tx_row[0][:16]}... has issues: "
+                    f"{tx_validation.issues}"
+                )
+
+        return block_data, tx_data
+
     async def collect(self, client):
         """
         Collect the next Bitcoin block and its transactions.
@@ -172,13 +844,21 @@ class BitcoinCollector:
         adjustments every 2016 blocks (~2 weeks). This is much slower than Ethereum's
         12 seconds, but Bitcoin prioritizes security and decentralization over speed.
 
+        Blocks are buffered rather than written every cycle, so the
+        records_collected metric counts the rows flushed during this cycle:
+        it is 0 for cycles that only buffer a block and covers several blocks
+        on the cycle that flushes them.
+
         Args:
             client: ClickHouse database client for inserting collected data
         """
         if not self.enabled:
             return
 
+        # Wall-clock time for the metric row; the duration is measured with
+        # perf_counter(), which is monotonic and needs no datetime arithmetic
         start_time = datetime.now()
+        started = time.perf_counter()
         records_collected = 0
         error_msg = ""
 
@@ -187,227 +867,50 @@ class BitcoinCollector:
             # We use aiohttp (async HTTP client) instead of requests (sync) to enable
             # concurrent API calls. This is important when collecting from multiple
             # blockchains simultaneously - we don't want to block while waiting for
-            # one API response.
-            async with aiohttp.ClientSession() as session:
-                # Get the current blockchain height (number of blocks)
-                latest_height_str = await self._api_call_with_retry(
-                    session, f"{self.rpc_url}/blocks/tip/height", return_type='text'
-                )
-                if latest_height_str is None:
-                    return  # API temporarily unavailable
-                latest_height = int(latest_height_str)
-
-                # If first run, start from latest block
-                if self.last_block_height is None:
-                    self.last_block_height = latest_height - 1
-
-                # Only collect if there's a new block
-                if self.last_block_height < latest_height:
-                    block_height = self.last_block_height + 1
-
-                    # Bitcoin requires two API calls: first get hash, then get block
-                    # This is because blocks are identified by hash, not height
-                    block_hash = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block-height/{block_height}", return_type='text'
-                    )
-                    if block_hash is None:
-                        return  # Block not found yet (404) - waiting for next block to be mined
-
-                    block = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block/{block_hash}", return_type='json'
-                    )
-                    if block is None:
-                        return  # Block not available
-
-                    # EDUCATIONAL NOTE - Fetching Transaction IDs:
-                    # The Blockstream API's /block/{hash} endpoint returns block metadata only.
-                    # To get transaction IDs, we need a separate API call to /block/{hash}/txids
-                    # This returns an array of transaction hashes (txids) that we can then query.
-                    all_tx_ids = await self._api_call_with_retry(
-                        session, f"{self.rpc_url}/block/{block_hash}/txids", return_type='json'
-                    )
-                    if all_tx_ids is None:
-                        return  # Transaction IDs not available
-
-                    # Limit to 25 transactions for educational purposes (explained below)
-                    tx_ids = all_tx_ids[:25]
-
-                    # EDUCATIONAL NOTE - Bitcoin Block Structure:
-                    #
-                    # block_height: Number of blocks since genesis (block 0). Also called
-                    #               "block number" in other chains.
-                    #
-                    # previous_block_hash: Links to parent block, creating the blockchain.
-                    #                      Genesis block has this set to all zeros.
-                    #
-                    # merkle_root: Root hash of a Merkle tree containing all transaction hashes.
-                    #              This allows efficient verification that a transaction is in
-                    #              a block without downloading all transactions (Simplified
-                    #              Payment Verification / SPV). Changing ANY transaction
-                    #              changes the merkle root.
-                    #
-                    # difficulty: A measure of how hard it is to find a valid block hash.
-                    #             Adjusts every 2016 blocks to maintain ~10 minute block times.
-                    #
-                    # nonce: A 32-bit number miners increment to find a valid block hash.
-                    #        A valid hash must be less than the target (derived from difficulty).
-                    #        This is the "work" in Proof-of-Work: trial and error until valid.
-                    #
-                    # size: Block size in bytes. Bitcoin has a ~1MB base block size limit.
-                    #
-                    # weight: Replaced "size" as the limiting factor after SegWit upgrade.
-                    #         Maximum weight is 4,000,000 units (allows ~1-4 MB of data).
-                    #         SegWit transactions have lower weight, incentivizing adoption.
-                    block_data = {
-                        'block_height': block_height,
-                        'block_hash': block['id'],
-                        'timestamp': datetime.fromtimestamp(block['timestamp']),
-                        'previous_block_hash': block['previousblockhash'],
-                        'merkle_root': block['merkle_root'],
-                        'difficulty': int(block['difficulty']),
-                        'nonce': block['nonce'],
-                        'size': block['size'],
-                        'weight': block['weight'],
-                        'transaction_count': block['tx_count']
-                    }
-
-                    # ================================================================
-                    # [VERACITY] Validate block data before insertion
-                    # ================================================================
-                    # This is a critical step in ensuring data quality. We check:
-                    # - All required fields are present
-                    # - Values are within expected ranges
-                    # - Timestamp is reasonable
-                    # - Hash formats are valid
-                    block_validation = self.validator.validate_bitcoin_block(block_data)
-
-                    if not block_validation.is_valid:
-                        logger.warning(
-                            f"[VERACITY] Bitcoin block {block_height} has quality issues: "
-                            f"{block_validation.issues}"
-                        )
-                        # Log quality issue for tracking and analysis
-                        log_quality_issue(
-                            source='bitcoin',
-                            record_type='block',
-                            record_id=str(block_height),
-                            result=block_validation,
-                            client=client
-                        )
-
-                    if block_validation.warnings:
-                        logger.info(
-                            f"[VERACITY] Bitcoin block {block_height} warnings: "
-                            f"{block_validation.warnings}"
-                        )
-
-                    # Convert dict to list for clickhouse_connect (required when table has DEFAULT columns)
-                    columns = ['block_height', 'block_hash', 'timestamp', 'previous_block_hash',
-                             'merkle_root', 'difficulty', 'nonce', 'size', 'weight', 'transaction_count']
-                    block_values = [[block_data[col] for col in columns]]
-                    client.insert('bitcoin_blocks', block_values, column_names=columns)
-                    records_collected += 1
-
-                    # EDUCATIONAL NOTE - API Rate Limiting:
-                    # We limit to 25 transactions per block for several reasons:
-                    # 1. API Rate Limits: Public APIs have request quotas
-                    # 2. Educational Focus: 25 transactions provide sufficient data for learning
-                    # 3. Performance: Bitcoin blocks can have 2000+ transactions
-                    # 4. Cost: Some APIs charge per request
-                    #
-                    # In production systems, you would:
-                    # - Use pagination to fetch all transactions
-                    # - Implement exponential backoff for rate limit errors
-                    # - Consider running your own Bitcoin node for unlimited access
-
-                    # tx_ids already fetched above from /block/{hash}/txids endpoint
-                    tx_data = []
-
-                    for tx_id in tx_ids:
-                        try:
-                            tx = await self._api_call_with_retry(
-                                session, f"{self.rpc_url}/tx/{tx_id}", return_type='json'
-                            )
-                            if tx is None:
-                                logger.warning(f"Could not fetch Bitcoin tx {tx_id}")
-                                continue
-
-                            # EDUCATIONAL NOTE - Bitcoin Transaction Structure (UTXO Model):
-                            #
-                            # Unlike Ethereum, Bitcoin transactions don't have a simple
-                            # "from" address field. The sender is determined by which
-                            # UTXOs (inputs) are being spent.
-                            #
-                            # vin (inputs): List of UTXOs being consumed (spent)
-                            #               Each input references a previous transaction output
-                            #
-                            # vout (outputs): List of new UTXOs being created
-                            #                 Each output has an amount and locking script
-                            #
-                            # input_count: Number of UTXOs being spent in this transaction
-                            # output_count: Number of new UTXOs being created
-                            #
-                            # fee: Satoshis paid to miners = sum(input values) - sum(output values)
-                            #      Higher fees = faster confirmation (miners prioritize profitable txs)
-                            #      Fee is implicit, not a separate field in the transaction
-                            #
-                            # size: Transaction size in bytes (affects fee calculation)
-                            # weight: SegWit-adjusted size for fee calculation
-                            #
-                            # Bitcoin's smallest unit: 1 Satoshi = 0.00000001 BTC (8 decimal places)
-                            tx_record = {
-                                'tx_hash': tx['txid'],
-                                'block_height': block_height,
-                                'block_hash': block['id'],
-                                'size': tx['size'],
-                                'weight': tx['weight'],
-                                'fee': int(tx.get('fee', 0)),  # Fee in satoshis, convert to int for UInt64
-                                'input_count': len(tx['vin']),
-                                'output_count': len(tx['vout']),
-                                'timestamp': datetime.fromtimestamp(block['timestamp'])
-                            }
-
-                            # [VERACITY] Validate transaction before adding to batch
-                            tx_validation = self.validator.validate_bitcoin_transaction(tx_record)
-                            if not tx_validation.is_valid:
-                                logger.debug(
-                                    f"[VERACITY] Bitcoin tx {tx['txid'][:16]}... has issues: "
-                                    f"{tx_validation.issues}"
-                                )
-
-                            tx_data.append(tx_record)
-                        except Exception as e:
-                            # Log but continue - don't let one bad transaction stop collection
-                            logger.warning(f"Error collecting Bitcoin tx {tx_id}: {e}")
-                            continue
-
-                    if tx_data:
-                        # Convert list of dicts to list of lists for clickhouse_connect
-                        # (required when table has DEFAULT columns)
-                        columns = ['tx_hash', 'block_height', 'block_hash', 'size',
-                                 'weight', 'fee', 'input_count', 'output_count', 'timestamp']
-                        tx_values = [[tx[col] for col in columns] for tx in tx_data]
-                        client.insert('bitcoin_transactions', tx_values, column_names=columns)
-                        records_collected += len(tx_data)
-
-                    self.last_block_height = block_height
-                    self.last_successful_collect = datetime.now()
-                    # Reduce retry delay on successful collection
-                    self.retry_delay = max(1, self.retry_delay // 2)
+            # one API response. The session is reused across collection cycles so
+            # its pooled connections skip the TCP + TLS handshake on every poll.
+            session = await self._ensure_session()
+            # Get the current blockchain height (number of blocks)
+            latest_height = await self._get_tip_height(session)
+            if latest_height is None:
+                return  # API temporarily unavailable
+
+            # If first run, start from latest block
+            if self.last_block_height is None:
+                self.last_block_height = latest_height - 1
+
+            # Only collect if there's a new block
+            collected_height = self._collected_height()
+            if collected_height < latest_height:
+                block_height = collected_height + 1
+
+                rows = await self._collect_block(session, client, block_height)
+                if rows is not None:
+                    block_data, tx_data = rows
+
+                    # The block is only buffered here; flush() writes buffered
+                    # blocks from many collection cycles together
+                    self._block_buffer.append(_bitcoin_block_row(block_data))
+                    self._tx_buffer.extend(tx_data)
+                    self._buffered_height = block_height
+
+                    self.last_successful_collect = time.monotonic()
                     logger.info(f"Collected Bitcoin block {block_height} with {len(tx_data)} transactions")
 
+            if self._flush_due():
+                records_collected += await self.flush(client)
+
         except Exception as e:
             error_msg = str(e)
             logger.error(f"Error collecting Bitcoin data: {e}")
 
         finally:
             # Record collection metrics for monitoring and analysis
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            client.insert('collection_metrics', [{
-                'metric_time': start_time,
-                'source': 'bitcoin',
-                'records_collected': records_collected,
-                'collection_duration_ms': duration_ms,
-                'error_count': 1 if error_msg else 0,
-                'error_message': error_msg
-            }])
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            await self._insert(
+                client, 'collection_metrics',
+                [[start_time, 'bitcoin', records_collected, duration_ms, 1 if error_msg else 0, error_msg]],
+                column_names=METRICS_COLUMNS,
+                column_type_names=METRICS_COLUMN_TYPES,
+                settings=ASYNC_INSERT_SETTINGS
+            )
@@ -35,11 +35,27 @@
 # """
 #
 # import logging
+# import time
 # from datetime import datetime
+# from operator import itemgetter
 # import aiohttp
+# import orjson
+#
+# from .data_validator import ASYNC_INSERT_SETTINGS, METRICS_COLUMNS, METRICS_COLUMN_TYPES
 #
 # logger = logging.getLogger(__name__)
 #
+# # Insert layouts for the Ethereum tables
+# ETH_BLOCK_COLUMNS = ('block_number', 'block_hash', 'timestamp', 'parent_hash', 'miner',
+#                      'difficulty', 'total_difficulty', 'size', 'gas_limit', 'gas_used', 'transaction_count')
+# ETH_BLOCK_COLUMN_TYPES = ('UInt64', 'String', 'DateTime', 'String', 'String',
+#                           'UInt64', 'String', 'UInt32', 'UInt64', 'UInt64', 'UInt32')
+# ETH_TX_COLUMNS = ('tx_hash', 'block_number', 'block_hash', 'from_address', 'to_address',
+#                   'value', 'gas', 'gas_price', 'nonce', 'transaction_index', 'timestamp')
+# ETH_TX_COLUMN_TYPES = ('String', 'UInt64', 'String', 'String', 'String',
+#                        'String', 'UInt64', 'String', 'UInt64', 'UInt32', 'DateTime')
+# _eth_block_row = itemgetter(*ETH_BLOCK_COLUMNS)
+#
 #
 # class EthereumCollector:
 #     """
@@ -69,6 +85,35 @@
 #         self.enabled = enabled
 #         # Track last processed block to avoid duplicates and ensure sequential collection
 #         self.last_block = None
+#         # HTTP session shared across collection cycles (created lazily)
+#         self._session = None
+#
+#     async def _ensure_session(self):
+#         """
+#         Return the collector's shared aiohttp session, creating it on first use.
+#
+#         EDUCATIONAL NOTE - Connection Reuse:
+#         Opening a new ClientSession every cycle forces a fresh TCP + TLS
+#         handshake with the RPC provider on each poll. A long-lived session
+#         keeps idle connections alive between polls so they can be reused.
+#
+#         Returns:
+#             aiohttp ClientSession
+#         """
+#         if self._session is None or self._session.closed:
+#             connector = aiohttp.TCPConnector(keepalive_timeout=75, limit=32)
+#             # Request payloads are encoded with orjson too (aiohttp expects a str)
+#             self._session = aiohttp.ClientSession(
+#                 connector=connector,
+#                 json_serialize=lambda obj: orjson.dumps(obj).decode()
+#             )
+#         return self._session
+#
+#     async def close(self):
+#         """Close the shared HTTP session and release its pooled connections."""
+#         if self._session is not None and not self._session.closed:
+#             await self._session.close()
+#         self._session = None
 #
 #     async def rpc_call(self, session, method: str, params: list):
 #         """
@@ -109,11 +154,47 @@
 #             "params": params
 #         }
 #         async with session.post(self.rpc_url, json=payload) as resp:
-#             result = await resp.json()
+#             # orjson decodes the raw bytes directly; blocks with full transaction
+#             # objects are tens of KB of nested JSON, where it is several times
+#             # faster than the stdlib json module that resp.json() uses
+#             result = orjson.loads(await resp.read())
 #             if 'error' in result:
 #                 raise Exception(f"RPC error: {result['error']}")
 #             return result.get('result')
 #
+#     async def rpc_batch(self, session, calls: list):
+#         """
+#         Make several JSON-RPC 2.0 calls in a single HTTP request.
+#
+#         EDUCATIONAL NOTE - JSON-RPC Batching:
+#         JSON-RPC 2.0 also accepts an array of request objects and answers with
+#         an array of responses. The server may reply in any order, so each
+#         response is matched back to its request by "id". Against a hosted
+#         provider (Infura, Alchemy) the network round trip dominates the cost
+#         of a small call, so a batch of two calls takes about as long as one.
+#
+#         Args:
+#             session: aiohttp client session for making HTTP requests
+#             calls: List of (method, params) tuples
+#
+#         Returns:
+#             List of 'result' fields in the same order as calls, with None for
+#             any call that failed (or for every call if the endpoint rejected
+#             the batch)
+#         """
+#         payload = [
+#             {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+#             for i, (method, params) in enumerate(calls)
+#         ]
+#         results = [None] * len(calls)
+#         async with session.post(self.rpc_url, json=payload) as resp:
+#             responses = orjson.loads(await resp.read())
+#         # An endpoint without batch support answers with a single error object
+#         if isinstance(responses, list):
+#             for response in responses:
+#                 results[response['id']] = response.get('result')
+#         return results
+#
 #     async def collect(self, client):
 #         """
 #         Collect the next Ethereum block and its transactions.
@@ -129,7 +210,10 @@
 #         if not self.enabled:
 #             return
 #
+#         # Wall-clock time for the metric row; the duration is measured with
+#         # perf_counter(), which is monotonic and needs no datetime arithmetic
 #         start_time = datetime.now()
+#         started = time.perf_counter()
 #         records_collected = 0
 #         error_msg = ""
 #
@@ -138,115 +222,136 @@
 #             # We use aiohttp (async HTTP client) instead of Web3.py to enable
 #             # better compatibility with free public RPC endpoints. Some free
 #             # endpoints reject Web3.py's HTTPProvider but accept standard JSON-RPC calls.
-#             async with aiohttp.ClientSession() as session:
-#                 # EDUCATIONAL NOTE - Block Numbers:
-#                 # Ethereum blocks are numbered sequentially starting from 0 (genesis block).
-#                 # The "latest" block is the most recently finalized block on the chain.
-#                 # Block numbers are also called "block height" in some contexts.
-#
+#             # The session is shared across collection cycles (see _ensure_session)
+#             session = await self._ensure_session()
+#             # EDUCATIONAL NOTE - Block Numbers:
+#             # Ethereum blocks are numbered sequentially starting from 0 (genesis block).
+#             # The "latest" block is the most recently finalized block on the chain.
+#             # Block numbers are also called "block height" in some contexts.
+#
+#             # EDUCATIONAL NOTE - Speculative Batching:
+#             # After the first cycle the next block to fetch is always last_block + 1,
+#             # so we ask for the current block number and that block in one batched
+#             # request, saving a round trip per cycle. If the guess is ahead of the
+#             # chain, eth_getBlockByNumber returns null and we retry next cycle.
+#             #
+#             # eth_getBlockByNumber takes two parameters:
+#             # 1. Block number as hex string (e.g., "0x10d4f")
+#             # 2. Boolean: true = return full transaction objects, false = just tx hashes
+#             #
+#             # We use true to get complete transaction data in one API call.
+#             # For production with high transaction counts, you might fetch separately.
+#             block_num_hex = None
+#             block = None
+#             speculated = self.last_block is not None
+#             if speculated:
+#                 block_num_hex, block = await self.rpc_batch(session, [
+#                     ("eth_blockNumber", []),
+#                     ("eth_getBlockByNumber", [hex(self.last_block + 1), True])
+#                 ])
+#             if block_num_hex is None:
+#                 # First run, or the endpoint rejected the batch: one call at a time
+#                 speculated = False
 #                 # Get current block number (returns hex string like "0x10d4f")
 #                 block_num_hex = await self.rpc_call(session, "eth_blockNumber", [])
-#                 latest_block_num = int(block_num_hex, 16)  # Convert hex to integer
+#             latest_block_num = int(block_num_hex, 16)  # Convert hex to integer
 #
-#                 # If first run, start from latest block (don't try to backfill history)
-#                 if self.last_block is None:
-#                     self.last_block = latest_block_num - 1
+#             # If first run, start from latest block (don't try to backfill history)
+#             if self.last_block is None:
+#                 self.last_block = latest_block_num - 1
 #
-#                 # Only collect if there's a new block we haven't processed
-#                 if self.last_block < latest_block_num:
-#                     block_num = self.last_block + 1
+#             # Only collect if there's a new block we haven't processed
+#             if self.last_block < latest_block_num:
+#                 block_num = self.last_block + 1
 #
-#                     # EDUCATIONAL NOTE - Block Retrieval Parameters:
-#                     # eth_getBlockByNumber takes two parameters:
-#                     # 1. Block number as hex string (e.g., "0x10d4f")
-#                     # 2. Boolean: true = return full transaction objects, false = just tx hashes
-#                     #
-#                     # We use true to get complete transaction data in one API call.
-#                     # For production with high transaction counts, you might fetch separately.
+#                 if not speculated:
 #                     block = await self.rpc_call(session, "eth_getBlockByNumber", [
 #                         hex(block_num),  # Convert integer to hex string
 #                         True  # Include full transaction objects
 #                     ])
 #
-#                     if block:
-#                         # EDUCATIONAL NOTE - Ethereum Block Structure:
-#                         # A block contains: header (metadata), transactions list, and uncles (ommers).
-#                         #
-#                         # Key fields explained:
-#                         # - hash: Unique identifier computed from block header using Keccak-256
-#                         # - parentHash: Links this block to the previous block, creating the "chain"
-#                         #   Changing any block changes its hash, invalidating all subsequent blocks
-#                         # - miner: Address that proposed this block (post-merge: the validator address)
-#                         # - difficulty: Legacy field from Proof-of-Work era; now always 0 post-merge
-#                         # - gasLimit: Maximum gas allowed in this block (~30M on mainnet)
-#                         # - gasUsed: Actual gas consumed by all transactions in this block
-#                         # - size: Block size in bytes (affects network propagation time)
-#                         block_data = {
-#                             'block_number': int(block['number'], 16),
-#                             'block_hash': block['hash'],  # Already a hex string
-#                             'timestamp': datetime.fromtimestamp(int(block['timestamp'], 16)),
-#                             'parent_hash': block['parentHash'],
-#                             'miner': block['miner'],
-#                             'difficulty': int(block['difficulty'], 16),
-#                             'total_difficulty': str(int(block.get('totalDifficulty', '0x0'), 16)),
-#                             'size': int(block['size'], 16),
-#                             'gas_limit': int(block['gasLimit'], 16),
-#                             'gas_used': int(block['gasUsed'], 16),
-#                             'transaction_count': len(block['transactions'])
-#                         }
-#
-#                         # Convert dict to list for clickhouse_connect (required when table has DEFAULT columns)
-#                         columns = ['block_number', 'block_hash', 'timestamp', 'parent_hash', 'miner',
-#                                  'difficulty', 'total_difficulty', 'size', 'gas_limit', 'gas_used', 'transaction_count']
-#                         block_values = [[block_data[col] for col in columns]]
-#                         client.insert('ethereum_blocks', block_values, column_names=columns)
-#                         records_collected += 1
-#
-#                         # EDUCATIONAL NOTE - Ethereum Transaction Fields:
-#                         #
-#                         # hash: Unique identifier computed from transaction contents
-#                         # from: The sender's 20-byte Ethereum address (derived from public key)
-#                         # to: Recipient address; null for contract creation transactions
-#                         # value: Amount of Ether transferred in Wei (1 ETH = 10^18 Wei)
-#                         # gas: Maximum gas the sender is willing to spend (gas limit for this tx)
-#                         # gasPrice: Price per gas unit in Wei (determines priority in block inclusion)
-#                         # nonce: Sequential counter for sender's account; prevents replay attacks
-#                         #        Each account's nonce starts at 0 and increments with each transaction
-#                         #        If you send tx with nonce 5, you must have already sent 0,1,2,3,4
-#                         # transactionIndex: Position in the block (0 = first transaction)
-#                         #
-#                         # Transaction Cost = gas_used * gas_price (actual cost after execution)
-#                         # The 'gas' field is the limit; actual gas_used may be less
-#                         tx_data = []
-#                         for tx in block['transactions']:
-#                             tx_record = {
-#                                 'tx_hash': tx['hash'],
-#                                 'block_number': int(tx['blockNumber'], 16),
-#                                 'block_hash': tx['blockHash'],
-#                                 'from_address': tx['from'],
-#                                 # to_address is None for contract creation transactions
-#                                 'to_address': tx['to'] if tx['to'] else '',
-#                                 # Value stored as string to handle large numbers (uint256)
-#                                 'value': str(int(tx['value'], 16)),
-#                                 'gas': int(tx['gas'], 16),
-#                                 'gas_price': str(int(tx['gasPrice'], 16)),
-#                                 'nonce': int(tx['nonce'], 16),
-#                                 'transaction_index': int(tx['transactionIndex'], 16),
-#                                 'timestamp': datetime.fromtimestamp(int(block['timestamp'], 16))
-#                             }
-#                             tx_data.append(tx_record)
-#
-#                         if tx_data:
-#                             # Convert list of dicts to list of lists for clickhouse_connect
-#                             # (required when table has DEFAULT columns)
-#                             columns = ['tx_hash', 'block_number', 'block_hash', 'from_address', 'to_address',
-#                                      'value', 'gas', 'gas_price', 'nonce', 'transaction_index', 'timestamp']
-#                             tx_values = [[tx[col] for col in columns] for tx in tx_data]
-#                             client.insert('ethereum_transactions', tx_values, column_names=columns)
-#                             records_collected += len(tx_data)
-#
-#                         self.last_block = block_num
-#                         logger.info(f"Collected Ethereum block {block_num} with {len(tx_data)} transactions")
+#                 if block:
+#                     # EDUCATIONAL NOTE - Ethereum Block Structure:
+#                     # A block contains: header (metadata), transactions list, and uncles (ommers).
+#                     #
+#                     # Key fields explained:
+#                     # - hash: Unique identifier computed from block header using Keccak-256
+#                     # - parentHash: Links this block to the previous block, creating the "chain"
+#                     #   Changing any block changes its hash, invalidating all subsequent blocks
+#                     # - miner: Address that proposed this block (post-merge: the validator address)
+#                     # - difficulty: Legacy field from Proof-of-Work era; now always 0 post-merge
+#                     # - gasLimit: Maximum gas allowed in this block (~30M on mainnet)
+#                     # - gasUsed: Actual gas consumed by all transactions in this block
+#                     # - size: Block size in bytes (affects network propagation time)
+#                     block_data = {
+#                         'block_number': int(block['number'], 16),
+#                         'block_hash': block['hash'],  # Already a hex string
+#                         'timestamp': datetime.fromtimestamp(int(block['timestamp'], 16)),
+#                         'parent_hash': block['parentHash'],
+#                         'miner': block['miner'],
+#                         'difficulty': int(block['difficulty'], 16),
+#                         'total_difficulty': str(int(block.get('totalDifficulty', '0x0'), 16)),
+#                         'size': int(block['size'], 16),
+#                         'gas_limit': int(block['gasLimit'], 16),
+#                         'gas_used': int(block['gasUsed'], 16),
+#                         'transaction_count': len(block['transactions'])
+#                     }
+#
+#                     client.insert('ethereum_blocks', [_eth_block_row(block_data)],
+#                                   column_names=ETH_BLOCK_COLUMNS, column_type_names=ETH_BLOCK_COLUMN_TYPES)
+#                     records_collected += 1
+#
+#                     # EDUCATIONAL NOTE - Ethereum Transaction Fields:
+#                     #
+#                     # hash: Unique identifier computed from transaction contents
+#                     # from: The sender's 20-byte Ethereum address (derived from public key)
+#                     # to: Recipient address; null for contract creation transactions
+#                     # value: Amount of Ether transferred in Wei (1 ETH = 10^18 Wei)
+#                     # gas: Maximum gas the sender is willing to spend (gas limit for this tx)
+#                     # gasPrice: Price per gas unit in Wei (determines priority in block inclusion)
+#                     # nonce: Sequential counter for sender's account; prevents replay attacks
+#                     #        Each account's nonce starts at 0 and increments with each transaction
+#                     #        If you send tx with nonce 5, you must have already sent 0,1,2,3,4
+#                     # transactionIndex: Position in the block (0 = first transaction)
+#                     #
+#                     # Transaction Cost = gas_used * gas_price (actual cost after execution)
+#                     # The 'gas' field is the limit; actual gas_used may be less
+#                     tx_data = []
+#                     # Every transaction shares the block's number, hash and timestamp;
+#                     # decode them once
+#                     block_number = block_data['block_number']
+#                     block_hash = block_data['block_hash']
+#                     block_timestamp = block_data['timestamp']
+#                     for tx in block['transactions']:
+#                         # Each row is a tuple in ethereum_transactions column order,
+#                         # ready for insertion without a per-tx dict
+#                         tx_data.append((
+#                             tx['hash'],
+#                             # blockNumber/blockHash are the same for every transaction
+#                             # in the block, so the already-decoded block values are
+#                             # reused instead of parsing the hex again per transaction
+#                             block_number,
+#                             block_hash,
+#                             tx['from'],
+#                             # to_address is None for contract creation transactions
+#                             tx['to'] or '',
+#                             # Value stored as string to handle large numbers (uint256)
+#                             str(int(tx['value'], 16)),
+#                             int(tx['gas'], 16),
+#                             str(int(tx['gasPrice'], 16)),
+#                             int(tx['nonce'], 16),
+#                             int(tx['transactionIndex'], 16),
+#                             block_timestamp
+#                         ))
+#
+#                     if tx_data:
+#                         # Rows are already tuples in ETH_TX_COLUMNS order
+#                         client.insert('ethereum_transactions', tx_data,
+#                                       column_names=ETH_TX_COLUMNS, column_type_names=ETH_TX_COLUMN_TYPES)
+#                         records_collected += len(tx_data)
+#
+#                     self.last_block = block_num
+#                     logger.info(f"Collected Ethereum block {block_num} with {len(tx_data)} transactions")
 #
 #         except Exception as e:
 #             error_msg = str(e)
@@ -259,12 +364,11 @@
 #             # 2. Error tracking (which chains have issues?)
 #             # 3. Throughput analysis (records per second)
 #             # This is a common pattern in data engineering pipelines.
-#             duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-#             client.insert('collection_metrics', [{
-#                 'metric_time': start_time,
-#                 'source': 'ethereum',
-#                 'records_collected': records_collected,
-#                 'collection_duration_ms': duration_ms,
-#                 'error_count': 1 if error_msg else 0,
-#                 'error_message': error_msg
-#             }])
+#             duration_ms = int((time.perf_counter() - started) * 1000)
+#             client.insert(
+#                 'collection_metrics',
+#                 [[start_time, 'ethereum', records_collected, duration_ms, 1 if error_msg else 0, error_msg]],
+#                 column_names=METRICS_COLUMNS,
+#                 column_type_names=METRICS_COLUMN_TYPES,
+#                 settings=ASYNC_INSERT_SETTINGS
+#             )
@@ -55,14 +55,27 @@ Why Solana is Fast:
 """
 
 import logging
+import time
 from datetime import datetime
+from operator import itemgetter
 import aiohttp
-import json
+import orjson
 
-from .data_validator import DataValidator, log_quality_issue
+from .data_validator import (
+    ASYNC_INSERT_SETTINGS, METRICS_COLUMNS, METRICS_COLUMN_TYPES, DataValidator, log_quality_issue
+)
 
 logger = logging.getLogger(__name__)
 
+# Solana inserts a block per slot, so these layouts are reused on every
+# insert rather than rebuilt each time
+SOLANA_BLOCK_COLUMNS = ('slot', 'block_height', 'block_hash', 'timestamp',
+                        'parent_slot', 'previous_block_hash', 'transaction_count')
+SOLANA_BLOCK_COLUMN_TYPES = ('UInt64', 'UInt64', 'String', 'DateTime', 'UInt64', 'String', 'UInt32')
+SOLANA_TX_COLUMNS = ('signature', 'slot', 'block_hash', 'fee', 'status', 'timestamp')
+SOLANA_TX_COLUMN_TYPES = ('String', 'UInt64', 'String', 'UInt64', 'String', 'DateTime')
+_solana_block_row = itemgetter(*SOLANA_BLOCK_COLUMNS)
+
 
 class SolanaCollector:
     """
@@ -95,6 +108,42 @@ class SolanaCollector:
         # [VERACITY] Initialize data validator for quality checks
         # Solana's high velocity makes quality checks especially important
         self.validator = DataValidator()
+        # HTTP session shared across collection cycles (created lazily)
+        self._session = None
+
+    async def _ensure_session(self):
+        """
+        Return the collector's shared aiohttp session, creating it on first use.
+
+        EDUCATIONAL NOTE - Connection Pooling:
+        At ~400ms per slot, Solana is polled far more often than it could
+        afford a new TCP + TLS handshake and DNS lookup per cycle. A single
+        long-lived session keeps a pool of warm connections to the RPC node:
+        the connector caps open sockets, keeps idle ones alive between polls,
+        and caches DNS results for 5 minutes.
+
+        Returns:
+            aiohttp ClientSession
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            # Request payloads are encoded with orjson too (aiohttp expects a str)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session and release its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def rpc_call(self, session, method: str, params: list):
         """
@@ -142,9 +191,53 @@ class SolanaCollector:
             "params": params
         }
         async with session.post(self.rpc_url, json=payload) as resp:
-            result = await resp.json()
+            # orjson decodes the raw bytes directly; full getBlock responses are
+            # hundreds of KB of nested JSON, where it is several times faster
+            # than the stdlib json module that resp.json() uses
+            result = orjson.loads(await resp.read())
             return result.get('result')
 
+    async def rpc_batch(self, session, calls: list):
+        """
+        Make several JSON-RPC 2.0 calls in a single HTTP request.
+
+        EDUCATIONAL NOTE - JSON-RPC Batching:
+        JSON-RPC 2.0 also accepts an array of request objects and answers with
+        an array of responses. The server may reply in any order, so each
+        response is matched back to its request by "id". Against a remote
+        public endpoint the network round trip dominates the cost of a small
+        call, so a batch of two calls takes about as long as one.
+
+        Args:
+            session: aiohttp client session for making HTTP requests
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of 'result' fields in the same order as calls, with None for
+            any call that failed (or for every call if the endpoint rejected
+            the batch)
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        results = [None] * len(calls)
+        async with session.post(self.rpc_url, json=payload) as resp:
+            responses = orjson.loads(await resp.read())
+        # An endpoint without batch support answers with a single error object
+        if not isinstance(responses, list):
+            logger.warning(f"Solana RPC batch rejected: {responses}")
+            return results
+        for response in responses:
+            # Error objects may carry "id": null (or no id) when the server
+            # could not tell which request failed; leave those slots as None
+            response_id = response.get('id')
+            if type(response_id) is int and 0 <= response_id < len(results):
+                results[response_id] = response.get('result')
+            else:
+                logger.warning(f"Solana RPC batch response without a valid id: {response.get('error')}")
+        return results
+
     async def collect(self, client):
         """
         Collect the next Solana block (slot) and its transactions.
@@ -161,195 +254,218 @@ class SolanaCollector:
         if not self.enabled:
             return
 
+        # Wall-clock time for the metric row; the duration is measured with
+        # perf_counter(), which is monotonic and needs no datetime arithmetic
         start_time = datetime.now()
+        started = time.perf_counter()
         records_collected = 0
         error_msg = ""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get the current slot number (like block height, but includes skipped)
+            # The session is shared across collection cycles (see _ensure_session)
+            session = await self._ensure_session()
+
+            # EDUCATIONAL NOTE - getBlock Parameters:
+            #
+            # encoding: "json" returns human-readable format
+            #           "base64" or "base58" for raw transaction data
+            #
+            # transactionDetails: "full" returns complete transaction data
+            #                     "signatures" returns only signatures (faster)
+            #                     "none" returns only block metadata
+            #
+            # rewards: Include staking rewards in response (we skip for simplicity)
+            #
+            # maxSupportedTransactionVersion: Solana has versioned transactions
+            #   - Version 0: Original transaction format
+            #   - Version 1+: Support address lookup tables (more accounts per tx)
+            #   Setting to 0 ensures we can parse all transaction versions
+            block_options = {
+                "encoding": "json",
+                "transactionDetails": "full",
+                "rewards": False,
+                "maxSupportedTransactionVersion": 0
+            }
+
+            # EDUCATIONAL NOTE - Speculative Batching:
+            # After the first cycle the next slot to fetch is always last_slot + 1,
+            # so we ask for the current slot (like block height, but includes
+            # skipped) and that block in one batched request, saving a round trip
+            # per cycle. If the guess is ahead of the chain, the getBlock half
+            # simply comes back empty and we try the same slot again next cycle.
+            latest_slot = None
+            block = None
+            speculated = self.last_slot is not None
+            if speculated:
+                latest_slot, block = await self.rpc_batch(session, [
+                    ("getSlot", []),
+                    ("getBlock", [self.last_slot + 1, block_options])
+                ])
+            if latest_slot is None:
+                # First run, or the endpoint rejected the batch: one call at a time
+                speculated = False
                 latest_slot = await self.rpc_call(session, "getSlot", [])
 
-                # If first run, start from latest slot
-                if self.last_slot is None:
-                    self.last_slot = latest_slot - 1
+            # If first run, start from latest slot
+            if self.last_slot is None:
+                self.last_slot = latest_slot - 1
+
+            # Only collect if there's a new slot
+            if self.last_slot < latest_slot:
+                slot = self.last_slot + 1
 
-                # Only collect if there's a new slot
-                if self.last_slot < latest_slot:
-                    slot = self.last_slot + 1
+                if not speculated:
+                    block = await self.rpc_call(session, "getBlock", [slot, block_options])
 
-                    # EDUCATIONAL NOTE - getBlock Parameters:
+                if block:
+                    # EDUCATIONAL NOTE - Solana Block Structure:
                     #
-                    # encoding: "json" returns human-readable format
-                    #           "base64" or "base58" for raw transaction data
+                    # slot: The slot number (time window index). Primary identifier.
+                    #       Unlike other chains, slot numbers can have gaps (skipped slots).
                     #
-                    # transactionDetails: "full" returns complete transaction data
-                    #                     "signatures" returns only signatures (faster)
-                    #                     "none" returns only block metadata
+                    # block_height: Count of confirmed blocks (no gaps, always sequential).
+                    #               block_height <= slot because slots can be skipped.
                     #
-                    # rewards: Include staking rewards in response (we skip for simplicity)
+                    # blockhash: Unique identifier for the block, computed from contents.
                     #
-                    # maxSupportedTransactionVersion: Solana has versioned transactions
-                    #   - Version 0: Original transaction format
-                    #   - Version 1+: Support address lookup tables (more accounts per tx)
-                    #   Setting to 0 ensures we can parse all transaction versions
-                    block = await self.rpc_call(session, "getBlock", [
-                        slot,
-                        {
-                            "encoding": "json",
-                            "transactionDetails": "full",
-                            "rewards": False,
-                            "maxSupportedTransactionVersion": 0
-                        }
-                    ])
-
-                    if block:
-                        # EDUCATIONAL NOTE - Solana Block Structure:
-                        #
-                        # slot: The slot number (time window index). Primary identifier.
-                        #       Unlike other chains, slot numbers can have gaps (skipped slots).
-                        #
-                        # block_height: Count of confirmed blocks (no gaps, always sequential).
-                        #               block_height <= slot because slots can be skipped.
-                        #
-                        # blockhash: Unique identifier for the block, computed from contents.
-                        #
-                        # blockTime: Unix timestamp when the block was produced.
-                        #            May be null if the block is too old or not yet available.
-                        #
-                        # parentSlot: The slot number of the parent block.
-                        #             parentSlot < slot, but might not be slot-1 if slots skipped.
-                        #
-                        # previousBlockhash: Hash of the parent block, creating the chain.
-                        block_data = {
-                            'slot': slot,
-                            'block_height': block.get('blockHeight', 0),
-                            'block_hash': block.get('blockhash', ''),
-                            'timestamp': datetime.fromtimestamp(block.get('blockTime', 0)) if block.get('blockTime') else datetime.now(),
-                            'parent_slot': block.get('parentSlot', 0),
-                            'previous_block_hash': block.get('previousBlockhash', ''),
-                            'transaction_count': len(block.get('transactions', []))
-                        }
-
-                        # ================================================================
-                        # [VERACITY] Validate block data before insertion
-                        # ================================================================
-                        # For Solana, we specifically check:
-                        # - Slot/block_height consistency (block_height <= slot)
-                        # - Parent slot is less than current slot
-                        # - Skipped slots detection (network health indicator)
-                        # - Timestamp is reasonable
-                        block_validation = self.validator.validate_solana_block(block_data)
-
-                        if not block_validation.is_valid:
-                            logger.warning(
-                                f"[VERACITY] Solana slot {slot} has quality issues: "
-                                f"{block_validation.issues}"
-                            )
-                            log_quality_issue(
-                                source='solana',
-                                record_type='block',
-                                record_id=str(slot),
-                                result=block_validation,
-                                client=client
-                            )
-
-                        if block_validation.warnings:
-                            # Skipped slots are common on Solana, log at debug level
-                            logger.debug(
-                                f"[VERACITY] Solana slot {slot} warnings: "
-                                f"{block_validation.warnings}"
+                    # blockTime: Unix timestamp when the block was produced.
+                    #            May be null if the block is too old or not yet available.
+                    #
+                    # parentSlot: The slot number of the parent block.
+                    #             parentSlot < slot, but might not be slot-1 if slots skipped.
+                    #
+                    # previousBlockhash: Hash of the parent block, creating the chain.
+                    block_data = {
+                        'slot': slot,
+                        'block_height': block.get('blockHeight', 0),
+                        'block_hash': block.get('blockhash', ''),
+                        'timestamp': datetime.fromtimestamp(block.get('blockTime', 0)) if block.get('blockTime') else datetime.now(),
+                        'parent_slot': block.get('parentSlot', 0),
+                        'previous_block_hash': block.get('previousBlockhash', ''),
+                        'transaction_count': len(block.get('transactions', []))
+                    }
+
+                    # ================================================================
+                    # [VERACITY] Validate block data before insertion
+                    # ================================================================
+                    # For Solana, we specifically check:
+                    # - Slot/block_height consistency (block_height <= slot)
+                    # - Parent slot is less than current slot
+                    # - Skipped slots detection (network health indicator)
+                    # - Timestamp is reasonable
+                    block_validation = self.validator.validate_solana_block(block_data)
+
+                    if not block_validation.is_valid:
+                        logger.warning(
+                            f"[VERACITY] Solana slot {slot} has quality issues: "
+                            f"{block_validation.issues}"
+                        )
+                        log_quality_issue(
+                            source='solana',
+                            record_type='block',
+                            record_id=str(slot),
+                            result=block_validation,
+                            client=client
+                        )
+
+                    if block_validation.warnings:
+                        # Skipped slots are common on Solana, log at debug level
+                        logger.debug(
+                            f"[VERACITY] Solana slot {slot} warnings: "
+                            f"{block_validation.warnings}"
+                        )
+
+                    client.insert('solana_blocks', [_solana_block_row(block_data)],
+                                  column_names=SOLANA_BLOCK_COLUMNS, column_type_names=SOLANA_BLOCK_COLUMN_TYPES)
+                    records_collected += 1
+
+                    # Process transactions
+                    tx_data = []
+                    transactions = block.get('transactions', [])
+                    # Every transaction shares the block's hash and timestamp; look
+                    # them up once instead of once per transaction
+                    block_hash = block_data['block_hash']
+                    block_timestamp = block_data['timestamp']
+
+                    # EDUCATIONAL NOTE - Why Limit to 50 Transactions:
+                    # Solana blocks can contain 1000+ transactions due to high throughput.
+                    # We limit to 50 for educational purposes:
+                    # 1. Keeps database size manageable for learning environment
+                    # 2. Demonstrates sampling technique common in big data processing
+                    # 3. Reduces API response time and memory usage
+                    # 4. Focus on quality of data understanding over quantity
+                    #
+                    # In production, you would either:
+                    # - Process all transactions (for completeness)
+                    # - Use Solana's Geyser plugin for real-time streaming
+                    # - Subscribe to specific programs/accounts of interest
+                    for tx in transactions[:50]:
+                        try:
+                            meta = tx.get('meta', {})
+                            transaction = tx.get('transaction', {})
+
+                            # EDUCATIONAL NOTE - Solana Transaction Structure:
+                            #
+                            # signatures: List of signatures on this transaction.
+                            #             The FIRST signature is the transaction ID!
+                            #             Unlike Ethereum where tx hash is computed from contents,
+                            #             Solana uses the fee payer's signature as the identifier.
+                            #             Uses Ed25519 elliptic curve cryptography (fast verification).
+                            #
+                            # fee: Transaction fee in Lamports (1 SOL = 10^9 Lamports).
+                            #      Fee = signature_count * lamports_per_signature (~5000 lamports).
+                            #      Much cheaper than Ethereum! (~$0.00025 vs $1-100).
+                            #
+                            # status: Determined by checking if 'err' field is null.
+                            #         'success': Transaction executed successfully
+                            #         'failed': Transaction failed (e.g., insufficient funds,
+                            #                   program error, account already in use)
+                            #
+                            #         IMPORTANT: Solana charges fees even for FAILED transactions!
+                            #         This differs from Ethereum which refunds unused gas but
+                            #         still consumes gas used up to the point of failure.
+                            signatures = transaction.get('signatures', [])
+                            signature = signatures[0] if signatures else ''
+
+                            # Rows are built directly as tuples in solana_transactions
+                            # column order, ready for insertion without a per-tx dict
+                            tx_row = (
+                                signature,
+                                slot,
+                                block_hash,
+                                int(meta.get('fee', 0)),  # Fee in lamports, convert to int for UInt64
+                                'success' if meta.get('err') is None else 'failed',
+                                block_timestamp
                             )
 
-                        # Convert dict to list for clickhouse_connect (required when table has DEFAULT columns)
-                        columns = ['slot', 'block_height', 'block_hash', 'timestamp',
-                                 'parent_slot', 'previous_block_hash', 'transaction_count']
-                        block_values = [[block_data[col] for col in columns]]
-                        client.insert('solana_blocks', block_values, column_names=columns)
-                        records_collected += 1
-
-                        # Process transactions
-                        tx_data = []
-                        transactions = block.get('transactions', [])
-
-                        # EDUCATIONAL NOTE - Why Limit to 50 Transactions:
-                        # Solana blocks can contain 1000+ transactions due to high throughput.
-                        # We limit to 50 for educational purposes:
-                        # 1. Keeps database size manageable for learning environment
-                        # 2. Demonstrates sampling technique common in big data processing
-                        # 3. Reduces API response time and memory usage
-                        # 4. Focus on quality of data understanding over quantity
-                        #
-                        # In production, you would either:
-                        # - Process all transactions (for completeness)
-                        # - Use Solana's Geyser plugin for real-time streaming
-                        # - Subscribe to specific programs/accounts of interest
-                        for tx in transactions[:50]:
-                            try:
-                                meta = tx.get('meta', {})
-                                transaction = tx.get('transaction', {})
-
-                                # EDUCATIONAL NOTE - Solana Transaction Structure:
-                                #
-                                # signatures: List of signatures on this transaction.
-                                #             The FIRST signature is the transaction ID!
-                                #             Unlike Ethereum where tx hash is computed from contents,
-                                #             Solana uses the fee payer's signature as the identifier.
-                                #             Uses Ed25519 elliptic curve cryptography (fast verification).
-                                #
-                                # fee: Transaction fee in Lamports (1 SOL = 10^9 Lamports).
-                                #      Fee = signature_count * lamports_per_signature (~5000 lamports).
-                                #      Much cheaper than Ethereum! (~$0.00025 vs $1-100).
-                                #
-                                # status: Determined by checking if 'err' field is null.
-                                #         'success': Transaction executed successfully
-                                #         'failed': Transaction failed (e.g., insufficient funds,
-                                #                   program error, account already in use)
-                                #
-                                #         IMPORTANT: Solana charges fees even for FAILED transactions!
-                                #         This differs from Ethereum which refunds unused gas but
-                                #         still consumes gas used up to the point of failure.
-                                signatures = transaction.get('signatures', [])
-                                signature = signatures[0] if signatures else ''
-
-                                tx_record = {
-                                    'signature': signature,
-                                    'slot': slot,
-                                    'block_hash': block.get('blockhash', ''),
-                                    'fee': int(meta.get('fee', 0)),  # Fee in lamports, convert to int for UInt64
-                                    'status': 'success' if meta.get('err') is None else 'failed',
-                                    'timestamp': datetime.fromtimestamp(block.get('blockTime', 0)) if block.get('blockTime') else datetime.now()
-                                }
-
-                                # [VERACITY] Validate transaction before adding to batch
-                                # Track failed transactions - they're charged fees but don't execute
-                                tx_validation = self.validator.validate_solana_transaction(tx_record)
-                                if not tx_validation.is_valid:
-                                    logger.debug(
-                                        f"[VERACITY] Solana tx {signature[:16]}... has issues: "
-                                        f"{tx_validation.issues}"
-                                    )
-
-                                tx_data.append(tx_record)
-                            except Exception as e:
-                                # Log but continue - individual transaction errors shouldn't stop collection
-                                logger.warning(f"Error processing Solana transaction: {e}")
-                                continue
-
-                        if tx_data:
-                            # Convert list of dicts to list of lists for clickhouse_connect
-                            columns = ['signature', 'slot', 'block_hash', 'fee', 'status', 'timestamp']
-                            tx_values = [[tx[col] for col in columns] for tx in tx_data]
-                            client.insert('solana_transactions', tx_values, column_names=columns)
-                            records_collected += len(tx_data)
-
-                        self.last_slot = slot
-                        logger.info(f"Collected Solana slot {slot} with {len(tx_data)} transactions")
-                    else:
-                        # Block not available - slot might be skipped or not yet confirmed
-                        # EDUCATIONAL NOTE: This is normal on Solana! Not every slot has a block.
-                        # The leader for that slot might have been offline or too slow.
-                        logger.debug(f"Solana slot {slot} not available yet")
+                            # [VERACITY] Validate transaction before adding to batch
+                            # Track failed transactions - they're charged fees but don't execute
+                            tx_validation = self.validator.validate_solana_transaction_row(tx_row)
+                            if not tx_validation.is_valid:
+                                logger.debug(
+                                    f"[VERACITY] Solana tx {signature[:16]}... has issues: "
+                                    f"{tx_validation.issues}"
+                                )
+
+                            tx_data.append(tx_row)
+                        except Exception as e:
+                            # Log but continue - individual transaction errors shouldn't stop collection
+                            logger.warning(f"Error processing Solana transaction: {e}")
+                            continue
+
+                    if tx_data:
+                        # Rows are already tuples in SOLANA_TX_COLUMNS order
+                        client.insert('solana_transactions', tx_data,
+                                      column_names=SOLANA_TX_COLUMNS, column_type_names=SOLANA_TX_COLUMN_TYPES)
+                        records_collected += len(tx_data)
+
+                    self.last_slot = slot
+                    logger.info(f"Collected Solana slot {slot} with {len(tx_data)} transactions")
+                else:
+                    # Block not available - slot might be skipped or not yet confirmed
+                    # EDUCATIONAL NOTE: This is normal on Solana! Not every slot has a block.
+                    # The leader for that slot might have been offline or too slow.
+                    logger.debug(f"Solana slot {slot} not available yet")
 
         except Exception as e:
             error_msg = str(e)
@@ -357,12 +473,11 @@ class SolanaCollector:
 
         finally:
             # Record collection metrics for monitoring dashboard
-            duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
-            client.insert('collection_metrics', [{
-                'metric_time': start_time,
-                'source': 'solana',
-                'records_collected': records_collected,
-                'collection_duration_ms': duration_ms,
-                'error_count': 1 if error_msg else 0,
-                'error_message': error_msg
-            }])
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            client.insert(
+                'collection_metrics',
+                [[start_time, 'solana', records_collected, duration_ms, 1 if error_msg else 0, error_msg]],
+                column_names=METRICS_COLUMNS,
+                column_type_names=METRICS_COLUMN_TYPES,
+                settings=ASYNC_INSERT_SETTINGS
+            )
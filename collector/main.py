@@ -59,6 +59,7 @@ The service exposes a REST API for control (start/stop) and monitoring (status).
 
 import asyncio
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 import logging
@@ -86,6 +87,21 @@ logger = logging.getLogger(__name__)
 # Load environment variables from .env file
 load_dotenv()
 
+# EDUCATIONAL NOTE - ClickHouse Sessions and Threads:
+# By default clickhouse-connect tags every request from a client with one
+# generated session id, and ClickHouse rejects concurrent queries within the
+# same session. Collectors run their inserts in worker threads so the event
+# loop stays responsive, which means one client can be used by several
+# threads at once - so requests are sent without a session id instead.
+clickhouse_connect.common.set_setting('autogenerate_session_id', False)
+
+# Collection settings are read from the environment once at startup; they do
+# not change while the process runs, so the loop need not re-read and re-parse
+# them every cycle
+COLLECTION_INTERVAL_SECONDS = int(os.getenv('COLLECTION_INTERVAL_SECONDS', 5))
+MAX_COLLECTION_TIME_MINUTES = int(os.getenv('MAX_COLLECTION_TIME_MINUTES', 10))
+MAX_DATA_SIZE_GB = float(os.getenv('MAX_DATA_SIZE_GB', 5))
+
 # EDUCATIONAL NOTE - FastAPI Application:
 # FastAPI automatically generates interactive API documentation at /docs (Swagger UI)
 # and /redoc (ReDoc). This is invaluable for API testing and documentation.
@@ -98,6 +114,9 @@ app = FastAPI(title="Blockchain Data Collector")
 # - Proper shutdown handling with signals
 collection_task: Optional[asyncio.Task] = None
 is_collecting = False
+# Set by /stop so the collection loop wakes from its between-cycle wait at once
+# instead of sleeping out the rest of the interval
+stop_requested = asyncio.Event()
 
 
 def validate_timestamp(timestamp: Optional[datetime], max_age_hours: int = 24) -> bool:
@@ -157,13 +176,19 @@ def get_clickhouse_client():
 
     The HTTP interface (port 8123) is used for queries; native interface (9000)
     exists for faster bulk operations.
+
+    Both insert bodies and query results are LZ4-compressed on the wire.
+    Hashes and signatures are long hex/base58 strings that compress well,
+    and LZ4 is cheap enough that the smaller payloads win even on a local
+    network.
     """
     return clickhouse_connect.get_client(
         host=os.getenv('CLICKHOUSE_HOST', 'clickhouse'),
         port=int(os.getenv('CLICKHOUSE_PORT', 8123)),
         username=os.getenv('CLICKHOUSE_USER', 'default'),
         password=os.getenv('CLICKHOUSE_PASSWORD', ''),
-        database=os.getenv('CLICKHOUSE_DB', 'blockchain_data')
+        database=os.getenv('CLICKHOUSE_DB', 'blockchain_data'),
+        compress='lz4'
     )
 
 
@@ -222,14 +247,14 @@ async def check_safety_limits(client) -> tuple[bool, str]:
         started_at, total_records, total_size_bytes = result.result_rows[0]
 
         # Check time limit
-        max_time = int(os.getenv('MAX_COLLECTION_TIME_MINUTES', 10))
+        max_time = MAX_COLLECTION_TIME_MINUTES
         if started_at:
             elapsed = datetime.now(timezone.utc) - started_at
             if elapsed > timedelta(minutes=max_time):
                 return False, f"Time limit exceeded ({max_time} minutes)"
 
         # Check data size limit
-        max_size_gb = float(os.getenv('MAX_DATA_SIZE_GB', 5))
+        max_size_gb = MAX_DATA_SIZE_GB
         size_gb = total_size_bytes / (1024**3)
         if size_gb >= max_size_gb:
             return False, f"Data size limit exceeded ({max_size_gb} GB)"
@@ -278,7 +303,7 @@ async def collect_data():
     global is_collecting
 
     client = get_clickhouse_client()
-    interval = int(os.getenv('COLLECTION_INTERVAL_SECONDS', 5))
+    interval = COLLECTION_INTERVAL_SECONDS
 
     logger.info("Starting data collection...")
 
@@ -342,51 +367,45 @@ async def collect_data():
             if tasks:
                 await asyncio.gather(*tasks, return_exceptions=True)
 
-            # EDUCATIONAL NOTE - UNION ALL for Multi-Table Counting:
-            # We use UNION ALL to combine counts from all tables in a single query.
-            # This is more efficient than running 6 separate queries.
+            # EDUCATIONAL NOTE - ClickHouse System Tables:
+            # ClickHouse exposes metadata through system.* tables:
+            # - system.parts: Information about data parts (storage units)
+            # - system.tables: Table metadata
+            # - system.columns: Column information
+            # - system.query_log: Query execution history
+            #
+            # 'active = 1' filters for current parts (excluding merged/deleted ones).
             #
-            # UNION vs UNION ALL:
-            # - UNION: Removes duplicate rows (slower, requires sorting)
-            # - UNION ALL: Keeps all rows including duplicates (faster)
+            # EDUCATIONAL NOTE - Counting from Part Metadata:
+            # A UNION ALL of count() per table starts a separate pipeline for
+            # every table. ClickHouse already records how many rows each data
+            # part holds in system.parts, so summing 'rows' over the active
+            # parts of the data tables gives the same total from one small
+            # metadata scan, without touching any table data.
             #
-            # Since we're counting distinct tables, duplicates are impossible,
-            # so UNION ALL is the correct and faster choice.
+            # Both totals come from the same scan in a single query (one round
+            # trip): sumIf() counts rows of the data tables only, while sum(bytes)
+            # gives actual disk usage, including compression, of the whole database.
             try:
-                total_records = client.query("""
+                totals_query = """
                     SELECT
-                        sum(cnt) as total
-                    FROM (
-                        -- ETHEREUM: Commented out - uncomment when re-enabling Ethereum
-                        -- SELECT count() as cnt FROM ethereum_blocks
-                        -- UNION ALL
-                        -- SELECT count() as cnt FROM ethereum_transactions
-                        -- UNION ALL
-                        SELECT count() as cnt FROM bitcoin_blocks
-                        UNION ALL
-                        SELECT count() as cnt FROM bitcoin_transactions
-                        UNION ALL
-                        SELECT count() as cnt FROM solana_blocks
-                        UNION ALL
-                        SELECT count() as cnt FROM solana_transactions
-                    )
-                """).result_rows[0][0]
-
-                # EDUCATIONAL NOTE - ClickHouse System Tables:
-                # ClickHouse exposes metadata through system.* tables:
-                # - system.parts: Information about data parts (storage units)
-                # - system.tables: Table metadata
-                # - system.columns: Column information
-                # - system.query_log: Query execution history
-                #
-                # 'active = 1' filters for current parts (excluding merged/deleted ones).
-                # This query gives us actual disk usage including compression.
-                total_size = client.query("""
-                    SELECT sum(bytes) as total_bytes
+                        sumIf(rows, table IN (
+                            -- ETHEREUM: Commented out - uncomment when re-enabling Ethereum
+                            -- 'ethereum_blocks', 'ethereum_transactions',
+                            'bitcoin_blocks', 'bitcoin_transactions',
+                            'solana_blocks', 'solana_transactions'
+                        )) as total_records,
+                        sum(bytes) as total_bytes
                     FROM system.parts
                     WHERE database = 'blockchain_data'
                     AND active = 1
-                """).result_rows[0][0] or 0
+                """
+
+                # Run in a worker thread so the event loop stays free meanwhile
+                totals = await asyncio.to_thread(client.query, totals_query)
+                total_records, total_size = totals.result_rows[0]
+                total_records = total_records or 0
+                total_size = total_size or 0
 
                 # Update state with current totals
                 client.command(f"""
@@ -396,12 +415,26 @@ async def collect_data():
             except Exception as e:
                 logger.error(f"Error updating totals: {e}")
 
-            # Sleep before next collection cycle
-            await asyncio.sleep(interval)
+            # EDUCATIONAL NOTE - Interruptible Waits:
+            # A plain asyncio.sleep(interval) would make /stop wait for the rest
+            # of the interval before the loop noticed. Waiting on the stop event
+            # with a timeout pauses just as long between cycles, but returns the
+            # moment a stop is requested.
+            try:
+                await asyncio.wait_for(stop_requested.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
 
     except Exception as e:
         logger.error(f"Error in collection loop: {e}")
     finally:
+        # Write any rows still buffered by the collectors so a stop does not
+        # lose the blocks collected since the last flush
+        try:
+            await bitcoin_collector.flush(client)
+        except Exception as e:
+            logger.error(f"Error flushing buffered Bitcoin data: {e}")
+
         # Always update state to stopped when exiting, regardless of how we exit
         # Preserve started_at if available
         if 'started_at' in locals():
@@ -430,6 +463,30 @@ async def collect_data():
 # OpenAPI documentation. Visit http://localhost:8000/docs to see it!
 
 
+@app.on_event("shutdown")
+async def shutdown_collectors():
+    """
+    Release resources held by the collectors when the service stops.
+
+    EDUCATIONAL NOTE - Long-Lived Connections:
+    Collectors keep their HTTP sessions open between collection cycles so
+    connections can be reused. Closing them on shutdown lets the pooled
+    sockets close cleanly instead of being dropped by the interpreter.
+
+    Bitcoin rows are buffered between batched inserts, so they are written
+    out first; otherwise every block collected since the last flush is lost.
+    """
+    try:
+        await bitcoin_collector.flush(get_clickhouse_client())
+    except Exception as e:
+        logger.error(f"Error flushing buffered Bitcoin data on shutdown: {e}")
+
+    # ETHEREUM: Commented out - uncomment when re-enabling Ethereum
+    # await ethereum_collector.close()
+    await bitcoin_collector.close()
+    await solana_collector.close()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - returns API information."""
@@ -454,6 +511,7 @@ async def start_collection():
         raise HTTPException(status_code=400, detail="Collection already running")
 
     is_collecting = True
+    stop_requested.clear()
     collection_task = asyncio.create_task(collect_data())
 
     return JSONResponse({"status": "started", "message": "Data collection started"})
@@ -465,8 +523,9 @@ async def stop_collection():
     Stop data collection.
 
     EDUCATIONAL NOTE - Graceful Shutdown:
-    We set is_collecting to False, which causes the collection loop to exit
-    on its next iteration. Then we 'await' the task to ensure it completes
+    We set is_collecting to False and signal stop_requested, which wakes the
+    collection loop if it is waiting between cycles so it exits right away
+    rather than after the rest of the interval. Then we 'await' the task to ensure it completes
     cleanly before returning. This is important for:
     - Flushing any pending database writes
     - Updating the collection state to "stopped"
@@ -478,6 +537,7 @@ async def stop_collection():
         raise HTTPException(status_code=400, detail="Collection not running")
 
     is_collecting = False
+    stop_requested.set()
 
     if collection_task:
         await collection_task
@@ -509,6 +569,7 @@ async def get_status():
             return {
                 "is_running": False,
                 "started_at": None,
+                "started_at_epoch": None,
                 "stopped_at": None,
                 "total_records": 0,
                 "total_size_bytes": 0,
@@ -522,29 +583,32 @@ async def get_status():
         total_records = row[3]
         total_size_bytes = row[4]
 
+        # EDUCATIONAL NOTE - Epoch Seconds:
+        # Timestamps are converted to Unix epoch seconds once, here. Elapsed
+        # time is then plain float subtraction, both below and in the dashboard
+        # (which receives started_at_epoch and never has to parse a date string
+        # on its one-second timer ticks).
+        started_at_epoch = None
+        if started_at:
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            started_at_epoch = started_at.timestamp()
+
         # Calculate records per second
         records_per_second = 0.0
-        if started_at and total_records > 0:
+        if started_at_epoch is not None and total_records > 0:
             try:
-                # Parse timestamp
-                start_time = datetime.fromisoformat(str(started_at).replace(' ', 'T'))
-
-                # Ensure timezone awareness
-                if start_time.tzinfo is None:
-                    start_time = start_time.replace(tzinfo=timezone.utc)
-
                 # Validate timestamp
-                if not validate_timestamp(start_time):
-                    logger.warning(f"Invalid start timestamp: {start_time}")
+                if not validate_timestamp(started_at):
+                    logger.warning(f"Invalid start timestamp: {started_at}")
                 else:
                     # Calculate elapsed time
                     if is_running:
-                        elapsed_seconds = (datetime.now(timezone.utc) - start_time).total_seconds()
+                        elapsed_seconds = time.time() - started_at_epoch
                     elif stopped_at:
-                        stop_time = datetime.fromisoformat(str(stopped_at).replace(' ', 'T'))
-                        if stop_time.tzinfo is None:
-                            stop_time = stop_time.replace(tzinfo=timezone.utc)
-                        elapsed_seconds = (stop_time - start_time).total_seconds()
+                        if stopped_at.tzinfo is None:
+                            stopped_at = stopped_at.replace(tzinfo=timezone.utc)
+                        elapsed_seconds = stopped_at.timestamp() - started_at_epoch
                     else:
                         elapsed_seconds = 0
 
@@ -557,8 +621,9 @@ async def get_status():
 
         return {
             "is_running": is_running,
-            "started_at": str(started_at).replace(' ', 'T') + 'Z' if started_at else None,
-            "stopped_at": str(stopped_at).replace(' ', 'T') + 'Z' if stopped_at else None,
+            "started_at": started_at.strftime('%Y-%m-%dT%H:%M:%SZ') if started_at else None,
+            "started_at_epoch": started_at_epoch,
+            "stopped_at": stopped_at.strftime('%Y-%m-%dT%H:%M:%SZ') if stopped_at else None,
             "total_records": total_records,
             "total_size_bytes": total_size_bytes,
             "records_per_second": records_per_second
@@ -568,6 +633,7 @@ async def get_status():
         return {
             "is_running": False,
             "started_at": None,
+            "started_at_epoch": None,
             "stopped_at": None,
             "total_records": 0,
             "total_size_bytes": 0,
@@ -1,75 +1,157 @@
 import { NextResponse } from 'next/server'
-import { createClient } from '@clickhouse/client'
+import { ClickHouseError } from '@clickhouse/client'
+import { getClickHouseClient } from '@/app/lib/clickhouse'
 
 export const dynamic = 'force-dynamic'
 export const revalidate = 0
 
+interface DataCounts {
+  total_records: number
+  bitcoin_blocks: number
+  bitcoin_transactions: number
+  solana_blocks: number
+  solana_transactions: number
+}
+
+// Every open dashboard polls this endpoint every 5 seconds. Counts are cached
+// in the server process for the same window, so N concurrent viewers cost
+// ClickHouse one query per window instead of N. Requests arriving while a
+// query is already running share its result instead of starting another.
+const CACHE_TTL_MS = 5000
+let cachedCounts: { data: DataCounts; expiresAt: number } | null = null
+let pendingCounts: Promise<DataCounts> | null = null
+
+// While ClickHouse is failing, the last successful counts (kept in
+// cachedCounts past their expiry) are served marked as stale instead of an
+// error, and queries are retried with exponential backoff (2s, 4s, 8s... up to
+// 30s) rather than on every poll from every open dashboard.
+const MAX_BACKOFF_MS = 30000
+let failureStreak = 0
+let retryAt = 0
+
+function staleResponse(data: DataCounts) {
+  return NextResponse.json({ ...data, stale: true })
+}
+
+// ClickHouse error code for a query against a table that does not exist
+const UNKNOWN_TABLE = '60'
+
+async function queryCounts(): Promise<DataCounts> {
+  const client = getClickHouseClient()
+
+  // record_counts is kept up to date by materialized views as rows are
+  // inserted (see clickhouse-init/01-init-schema.sql), so reading the counts
+  // is a four-row read rather than a count over each table.
+  let resultSet
+  try {
+    resultSet = await client.query({
+      query: `
+        SELECT source AS table, sum(total) AS row_count
+        FROM record_counts
+        GROUP BY source
+      `,
+      format: 'JSONEachRow',
+    })
+  } catch (error) {
+    // Any other failure (timeout, connection refused...) is a real error:
+    // retrying it against system.parts would only double the failing queries
+    if (!(error instanceof ClickHouseError && error.code === UNKNOWN_TABLE)) {
+      throw error
+    }
+    // Databases created before record_counts existed don't have it; fall
+    // back to summing row counts from part metadata. system.parts records
+    // how many rows every data part holds, so this is one small metadata
+    // scan rather than four separate count() pipelines. Tables with no data
+    // have no parts and are simply absent from the result (reported as 0).
+    resultSet = await client.query({
+      query: `
+        SELECT table, sum(rows) AS row_count
+        FROM system.parts
+        WHERE database = currentDatabase()
+          AND active = 1
+          AND table IN ('bitcoin_blocks', 'bitcoin_transactions', 'solana_blocks', 'solana_transactions')
+        GROUP BY table
+      `,
+      format: 'JSONEachRow',
+    })
+  }
+
+  const rows = await resultSet.json<{ table: string; row_count: number }>()
+
+  // Map table name -> count
+  const counts: Record<string, number> = {}
+  for (const row of rows) {
+    counts[row.table] = row.row_count
+  }
+
+  const bitcoinBlocks = counts.bitcoin_blocks ?? 0
+  const bitcoinTransactions = counts.bitcoin_transactions ?? 0
+  const solanaBlocks = counts.solana_blocks ?? 0
+  const solanaTransactions = counts.solana_transactions ?? 0
+
+  return {
+    total_records:
+      bitcoinBlocks + bitcoinTransactions + solanaBlocks + solanaTransactions,
+    bitcoin_blocks: bitcoinBlocks,
+    bitcoin_transactions: bitcoinTransactions,
+    solana_blocks: solanaBlocks,
+    solana_transactions: solanaTransactions,
+  }
+}
+
 /**
  * GET /api/data
  *
  * Returns aggregate counts for all blockchain data tables.
  * This endpoint queries ClickHouse to get the total number of records
  * for each blockchain type (Bitcoin blocks, Bitcoin transactions, etc.)
+ * Results are cached for 5 seconds, matching the dashboard refresh interval.
+ * If ClickHouse is unreachable, the last successful counts are returned with
+ * `stale: true`.
  */
 export async function GET() {
-  try {
-    // Create ClickHouse client with proper URL format
-    const host = process.env.CLICKHOUSE_HOST || 'clickhouse'
-    const port = process.env.CLICKHOUSE_PORT || '8123'
-    const url = host.startsWith('http') ? host : `http://${host}:${port}`
-
-    const client = createClient({
-      url: url,
-      username: process.env.CLICKHOUSE_USER || 'default',
-      password: process.env.CLICKHOUSE_PASSWORD || 'clickhouse_password',
-      database: process.env.CLICKHOUSE_DB || 'blockchain_data',
-      request_timeout: 10000,
-    })
+  if (cachedCounts && cachedCounts.expiresAt > Date.now()) {
+    return NextResponse.json(cachedCounts.data)
+  }
 
-    // Query counts for all tables
-    const resultSet = await client.query({
-      query: `
-        SELECT
-          (SELECT count() FROM bitcoin_blocks) as bitcoin_blocks,
-          (SELECT count() FROM bitcoin_transactions) as bitcoin_transactions,
-          (SELECT count() FROM solana_blocks) as solana_blocks,
-          (SELECT count() FROM solana_transactions) as solana_transactions
-      `,
-      format: 'JSONEachRow',
-    })
+  if (failureStreak > 0 && Date.now() < retryAt) {
+    if (cachedCounts) {
+      return staleResponse(cachedCounts.data)
+    }
+    return NextResponse.json(
+      { error: 'Failed to fetch blockchain data', details: 'Retrying after backoff' },
+      { status: 503 }
+    )
+  }
 
-    const data = await resultSet.json<{
-      bitcoin_blocks: string
-      bitcoin_transactions: string
-      solana_blocks: string
-      solana_transactions: string
-    }>()
-
-    await client.close()
-
-    // Parse counts and calculate total
-    const counts = data[0] || {
-      bitcoin_blocks: '0',
-      bitcoin_transactions: '0',
-      solana_blocks: '0',
-      solana_transactions: '0',
+  try {
+    if (!pendingCounts) {
+      // Success and failure are recorded here, once per query, rather than in
+      // each caller: every request that arrives while the query is running
+      // awaits this same promise
+      pendingCounts = queryCounts()
+        .then((data) => {
+          cachedCounts = { data, expiresAt: Date.now() + CACHE_TTL_MS }
+          failureStreak = 0
+          return data
+        })
+        .catch((error) => {
+          failureStreak += 1
+          retryAt = Date.now() + Math.min(MAX_BACKOFF_MS, 1000 * 2 ** failureStreak)
+          console.error(`Error fetching data (failure ${failureStreak} in a row):`, error)
+          throw error
+        })
+        .finally(() => {
+          pendingCounts = null
+        })
     }
+    const data = await pendingCounts
 
-    const bitcoinBlocks = parseInt(counts.bitcoin_blocks) || 0
-    const bitcoinTransactions = parseInt(counts.bitcoin_transactions) || 0
-    const solanaBlocks = parseInt(counts.solana_blocks) || 0
-    const solanaTransactions = parseInt(counts.solana_transactions) || 0
-
-    return NextResponse.json({
-      total_records:
-        bitcoinBlocks + bitcoinTransactions + solanaBlocks + solanaTransactions,
-      bitcoin_blocks: bitcoinBlocks,
-      bitcoin_transactions: bitcoinTransactions,
-      solana_blocks: solanaBlocks,
-      solana_transactions: solanaTransactions,
-    })
+    return NextResponse.json(data)
   } catch (error) {
-    console.error('Error fetching data:', error)
+    if (cachedCounts) {
+      return staleResponse(cachedCounts.data)
+    }
     return NextResponse.json(
       {
         error: 'Failed to fetch blockchain data',
@@ -1,25 +1,14 @@
 import { NextResponse } from 'next/server'
+import { collectorRequest } from '@/app/lib/collector'
 
 export async function POST() {
   try {
-    const collectorUrl = process.env.COLLECTOR_URL || 'http://collector:8000'
-
-    const controller = new AbortController()
-    const timeoutId = setTimeout(() => controller.abort(), 5000)
-
-    const res = await fetch(`${collectorUrl}/start`, {
-      method: 'POST',
-      cache: 'no-store',
-      signal: controller.signal,
-    })
-
-    clearTimeout(timeoutId)
-
-    const data = await res.json()
+    const res = await collectorRequest('/start', 'POST', 5000)
+    const data = res.data
 
     if (!res.ok) {
       return NextResponse.json(
-        { error: data.detail || 'Failed to start collection' },
+        { error: data?.detail || 'Failed to start collection' },
         { status: res.status }
       )
     }
@@ -1,18 +1,9 @@
 import { NextResponse } from 'next/server'
+import { collectorRequest } from '@/app/lib/collector'
 
 export async function GET() {
   try {
-    const collectorUrl = process.env.COLLECTOR_URL || 'http://collector:8000'
-
-    const controller = new AbortController()
-    const timeoutId = setTimeout(() => controller.abort(), 5000)
-
-    const res = await fetch(`${collectorUrl}/status`, {
-      cache: 'no-store',
-      signal: controller.signal,
-    })
-
-    clearTimeout(timeoutId)
+    const res = await collectorRequest('/status', 'GET', 5000)
 
     if (!res.ok) {
       return NextResponse.json(
@@ -21,7 +12,7 @@ export async function GET() {
       )
     }
 
-    const data = await res.json()
+    const data = res.data
     return NextResponse.json(data)
   } catch (error) {
     const errorMessage = error instanceof Error ? error.message : 'Unknown error'
@@ -1,25 +1,14 @@
 import { NextResponse } from 'next/server'
+import { collectorRequest } from '@/app/lib/collector'
 
 export async function POST() {
   try {
-    const collectorUrl = process.env.COLLECTOR_URL || 'http://collector:8000'
-
-    const controller = new AbortController()
-    const timeoutId = setTimeout(() => controller.abort(), 15000)  // 15-second timeout
-
-    const res = await fetch(`${collectorUrl}/stop`, {
-      method: 'POST',
-      cache: 'no-store',
-      signal: controller.signal,
-    })
-
-    clearTimeout(timeoutId)
-
-    const data = await res.json()
+    const res = await collectorRequest('/stop', 'POST', 15000)  // 15-second timeout
+    const data = res.data
 
     if (!res.ok) {
       return NextResponse.json(
-        { error: data.detail || 'Failed to stop collection' },
+        { error: data?.detail || 'Failed to stop collection' },
         { status: res.status }
       )
     }
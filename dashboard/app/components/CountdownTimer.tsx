@@ -4,48 +4,36 @@ import { useState, useEffect } from 'react'
 import { formatTime, getTimerColor } from '@/app/lib/utils'
 
 interface CountdownTimerProps {
-  startedAt: string | null
+  startedAtEpoch: number | null
   isRunning: boolean
   maxMinutes: number
 }
 
 export default function CountdownTimer({
-  startedAt,
+  startedAtEpoch,
   isRunning,
   maxMinutes,
 }: CountdownTimerProps) {
-  const [secondsRemaining, setSecondsRemaining] = useState<number>(maxMinutes * 60)
+  const totalSeconds = maxMinutes * 60
+  const [secondsRemaining, setSecondsRemaining] = useState<number>(totalSeconds)
 
-  // Validate timestamp is fresh and not stale
-  const isValidStartTime = (timestamp: string | null): boolean => {
-    if (!timestamp) return false
-    // Normalize timestamp: replace space with 'T' for ISO 8601 format
-    const normalized = timestamp.replace(' ', 'T')
-    const started = new Date(normalized).getTime()
-    const now = Date.now()
-    const elapsed = (now - started) / 1000
-    // Validate timestamp is recent and not in future
-    return elapsed >= 0 && elapsed < maxMinutes * 60
-  }
+  // The collector reports the start time as epoch seconds, so each
+  // one-second tick is plain arithmetic against Date.now()
+  const startedMs = startedAtEpoch === null ? null : startedAtEpoch * 1000
 
   useEffect(() => {
-    if (!startedAt || !isRunning) {
-      setSecondsRemaining(maxMinutes * 60)
+    if (startedMs === null || !isRunning) {
+      setSecondsRemaining(totalSeconds)
       return
     }
 
     const calculateRemaining = () => {
-      if (!isValidStartTime(startedAt)) {
-        return maxMinutes * 60 // Return max time if invalid
+      const elapsed = Math.floor((Date.now() - startedMs) / 1000)
+      // Validate timestamp is recent and not in future
+      if (!(elapsed >= 0 && elapsed < totalSeconds)) {
+        return totalSeconds // Return max time if invalid
       }
-
-      // Normalize timestamp: replace space with 'T' for ISO 8601 format
-      const normalizedTimestamp = startedAt.replace(' ', 'T')
-      const started = new Date(normalizedTimestamp).getTime()
-      const now = Date.now()
-      const elapsed = Math.floor((now - started) / 1000)
-      const total = maxMinutes * 60
-      return Math.max(0, total - elapsed)
+      return Math.max(0, totalSeconds - elapsed)
     }
 
     setSecondsRemaining(calculateRemaining())
@@ -60,11 +48,11 @@ export default function CountdownTimer({
     }, 1000)
 
     return () => clearInterval(interval)
-  }, [startedAt, isRunning, maxMinutes])
+  }, [startedMs, isRunning, totalSeconds])
 
   const colorClass = getTimerColor(secondsRemaining)
 
-  if (!isRunning || !startedAt) {
+  if (!isRunning || startedAtEpoch === null) {
     return (
       <div className="text-center">
         <div className="text-4xl font-mono font-bold text-gray-400">--:--</div>
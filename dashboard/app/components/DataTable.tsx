@@ -1,5 +1,6 @@
 'use client'
 
+import { memo } from 'react'
 import { formatNumber } from '@/app/lib/utils'
 
 interface DataTableProps {
@@ -10,7 +11,7 @@ interface DataTableProps {
   totalRecords: number
 }
 
-export default function DataTable({
+function DataTable({
   bitcoinBlocks,
   bitcoinTransactions,
   solanaBlocks,
@@ -45,8 +46,8 @@ export default function DataTable({
             </tr>
           </thead>
           <tbody className="bg-white divide-y divide-gray-200">
-            {rows.map((row, index) => (
-              <tr key={index} className="hover:bg-gray-50 transition-colors">
+            {rows.map((row) => (
+              <tr key={`${row.source}-${row.type}`} className="hover:bg-gray-50 transition-colors">
                 <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">
                   {row.source}
                 </td>
@@ -75,3 +76,7 @@ export default function DataTable({
     </div>
   )
 }
+
+// Memoized on its numeric props so polls that return unchanged counts don't
+// re-render and re-format every row of the table
+export default memo(DataTable)
@@ -2,6 +2,10 @@
 
 import { formatNumber, formatDataSize } from '@/app/lib/utils'
 
+const formatRate = (rate: number) => {
+  return `${rate.toFixed(2)} records/sec`
+}
+
 interface MetricsGridProps {
   totalRecords: number
   dataSizeBytes: number
@@ -21,10 +25,6 @@ export default function MetricsGrid({
   solanaBlocks,
   solanaTransactions,
 }: MetricsGridProps) {
-  const formatRate = (rate: number) => {
-    return `${rate.toFixed(2)} records/sec`
-  }
-
   const metrics = [
     {
       label: 'Total Records',
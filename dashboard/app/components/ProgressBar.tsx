@@ -1,27 +1,23 @@
 'use client'
 
 import { useMemo } from 'react'
-import { getElapsedSeconds, getTimerColor } from '@/app/lib/utils'
+import { getTimerColor } from '@/app/lib/utils'
 
 interface ProgressBarProps {
-  startedAt: string | null
+  startedAtEpoch: number | null
   isRunning: boolean
   maxMinutes: number
 }
 
 export default function ProgressBar({
-  startedAt,
+  startedAtEpoch,
   isRunning,
   maxMinutes,
 }: ProgressBarProps) {
   const progress = useMemo(() => {
-    if (!startedAt || !isRunning) return 0
+    if (startedAtEpoch === null || !isRunning) return 0
 
-    // Normalize timestamp: replace space with 'T' for ISO 8601 format
-    const normalizedTimestamp = startedAt.replace(' ', 'T')
-    const started = new Date(normalizedTimestamp).getTime()
-    const now = Date.now()
-    const elapsedMs = now - started
+    const elapsedMs = Date.now() - startedAtEpoch * 1000
 
     // Reject if timestamp is in future or older than max collection time
     const maxMs = maxMinutes * 60 * 1000
@@ -34,15 +30,15 @@ export default function ProgressBar({
     const percentage = Math.min(100, (elapsedSeconds / totalSeconds) * 100)
 
     return Math.round(percentage)
-  }, [startedAt, isRunning, maxMinutes])
+  }, [startedAtEpoch, isRunning, maxMinutes])
 
   const secondsRemaining = useMemo(() => {
-    if (!startedAt || !isRunning) return 0
+    if (startedAtEpoch === null || !isRunning) return 0
 
-    const elapsed = getElapsedSeconds(startedAt)
+    const elapsed = Math.max(0, Math.floor(Date.now() / 1000 - startedAtEpoch))
     const total = maxMinutes * 60
     return Math.max(0, total - elapsed)
-  }, [startedAt, isRunning, maxMinutes])
+  }, [startedAtEpoch, isRunning, maxMinutes])
 
   const colorClass = getTimerColor(secondsRemaining)
 
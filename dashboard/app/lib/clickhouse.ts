@@ -1,7 +1,19 @@
 import { createClient, ClickHouseClient } from '@clickhouse/client'
 
+// One client shared by every dashboard query (the previews below and the
+// counts in /api/data) for the life of the server process. The client keeps
+// its own pool of keep-alive HTTP connections, so the queries of a refresh run
+// in parallel on reused sockets rather than each opening (and closing) a
+// client of its own. The pool's default size already exceeds the five queries
+// the dashboard issues at once.
+let sharedClient: ClickHouseClient | null = null
+
 // ClickHouse client configuration
-const getClickHouseClient = (): ClickHouseClient => {
+export const getClickHouseClient = (): ClickHouseClient => {
+  if (sharedClient) {
+    return sharedClient
+  }
+
   const host = process.env.CLICKHOUSE_HOST || 'clickhouse'
   const port = process.env.CLICKHOUSE_PORT || '8123'
   const username = process.env.CLICKHOUSE_USER || 'default'
@@ -11,7 +23,7 @@ const getClickHouseClient = (): ClickHouseClient => {
   // Construct the URL in the format: http://hostname:port
   const url = host.startsWith('http') ? host : `http://${host}:${port}`
 
-  return createClient({
+  sharedClient = createClient({
     url: url,
     username: username,
     password: password,
@@ -21,7 +33,14 @@ const getClickHouseClient = (): ClickHouseClient => {
       response: true,
       request: false,
     },
+    // UInt64 columns (block_height, slot, fee, counts, ...) arrive as JSON
+    // numbers matching the interfaces below, instead of quoted strings.
+    // These values stay far below 2^53, where JavaScript numbers lose precision.
+    clickhouse_settings: {
+      output_format_json_quote_64bit_integers: 0,
+    },
   })
+  return sharedClient
 }
 
 // Bitcoin Blocks Preview
@@ -69,7 +88,6 @@ export async function getBitcoinBlocksPreview(
     })
 
     const rawData = await resultSet.json<BitcoinBlock>()
-    await client.close()
 
     // Ensure we always return an array
     if (Array.isArray(rawData)) {
@@ -79,7 +97,6 @@ export async function getBitcoinBlocksPreview(
     console.warn('ClickHouse returned non-array data:', typeof rawData)
     return []
   } catch (error) {
-    await client.close()
     console.error('Error fetching Bitcoin blocks:', error)
     console.error('Error details:', error instanceof Error ? error.message : 'Unknown error')
     throw error
@@ -129,7 +146,6 @@ export async function getBitcoinTransactionsPreview(
     })
 
     const rawData = await resultSet.json<BitcoinTransaction>()
-    await client.close()
 
     // Ensure we always return an array
     if (Array.isArray(rawData)) {
@@ -139,7 +155,6 @@ export async function getBitcoinTransactionsPreview(
     console.warn('ClickHouse returned non-array data:', typeof rawData)
     return []
   } catch (error) {
-    await client.close()
     console.error('Error fetching Bitcoin transactions:', error)
     console.error('Error details:', error instanceof Error ? error.message : 'Unknown error')
     throw error
@@ -185,7 +200,6 @@ export async function getSolanaBlocksPreview(
     })
 
     const rawData = await resultSet.json<SolanaBlock>()
-    await client.close()
 
     // Ensure we always return an array
     if (Array.isArray(rawData)) {
@@ -195,7 +209,6 @@ export async function getSolanaBlocksPreview(
     console.warn('ClickHouse returned non-array data:', typeof rawData)
     return []
   } catch (error) {
-    await client.close()
     console.error('Error fetching Solana blocks:', error)
     console.error('Error details:', error instanceof Error ? error.message : 'Unknown error')
     throw error
@@ -239,7 +252,6 @@ export async function getSolanaTransactionsPreview(
     })
 
     const rawData = await resultSet.json<SolanaTransaction>()
-    await client.close()
 
     // Ensure we always return an array
     if (Array.isArray(rawData)) {
@@ -249,7 +261,6 @@ export async function getSolanaTransactionsPreview(
     console.warn('ClickHouse returned non-array data:', typeof rawData)
     return []
   } catch (error) {
-    await client.close()
     console.error('Error fetching Solana transactions:', error)
     console.error('Error details:', error instanceof Error ? error.message : 'Unknown error')
     throw error
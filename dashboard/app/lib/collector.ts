@@ -0,0 +1,60 @@
+import http from 'node:http'
+import https from 'node:https'
+
+const collectorUrl = process.env.COLLECTOR_URL || 'http://collector:8000'
+const transport = collectorUrl.startsWith('https') ? https : http
+
+// One keep-alive agent shared by every collector API route. The dashboard polls
+// /status every 5 seconds; fetch() drops idle connections after 4 seconds, so
+// nearly every poll paid for a new TCP connection. Pooled sockets stay open
+// between polls (the collector keeps idle connections for 75 seconds).
+const agent = new transport.Agent({ keepAlive: true, maxSockets: 4 })
+
+export interface CollectorResponse {
+  ok: boolean
+  status: number
+  data: Record<string, any> | null
+}
+
+/**
+ * Send a request to the collector service over the shared keep-alive agent.
+ *
+ * Rejects with an error named 'AbortError' if the collector sends nothing for
+ * timeoutMs, matching fetch() with an AbortController. `data` is the parsed
+ * JSON body, or null if the body is not JSON.
+ */
+export function collectorRequest(
+  path: string,
+  method: 'GET' | 'POST',
+  timeoutMs: number
+): Promise<CollectorResponse> {
+  return new Promise((resolve, reject) => {
+    const req = transport.request(
+      `${collectorUrl}${path}`,
+      { method, agent, timeout: timeoutMs },
+      (res) => {
+        const chunks: Buffer[] = []
+        res.on('data', (chunk: Buffer) => chunks.push(chunk))
+        res.on('error', reject)
+        res.on('end', () => {
+          const status = res.statusCode ?? 500
+          let data = null
+          try {
+            data = JSON.parse(Buffer.concat(chunks).toString('utf8'))
+          } catch {
+            data = null
+          }
+          resolve({ ok: status >= 200 && status < 300, status, data })
+        })
+      }
+    )
+
+    req.on('timeout', () => {
+      const error = new Error('The operation was aborted')
+      error.name = 'AbortError'
+      req.destroy(error)
+    })
+    req.on('error', reject)
+    req.end()
+  })
+}
@@ -11,6 +11,8 @@ export interface MetricsData {
   bitcoin_transactions: number
   solana_blocks: number
   solana_transactions: number
+  /** Set when ClickHouse is unreachable and these are the last known counts */
+  stale?: boolean
 }
 
 /**
@@ -19,6 +21,8 @@ export interface MetricsData {
 export interface CollectorStatus {
   is_running: boolean
   started_at: string | null
+  /** started_at as Unix epoch seconds, so clients can time against Date.now() without parsing */
+  started_at_epoch: number | null
   stopped_at: string | null
   total_records: number
   total_size_bytes: number
@@ -1,3 +1,15 @@
+// One shared formatter: toLocaleString() and `new Intl.NumberFormat()` both
+// build locale formatting data on every call, while format() on an existing
+// instance does not
+const integerFormat = new Intl.NumberFormat('en-US')
+
+/**
+ * Format a number with comma separators (e.g. 1234567 -> "1,234,567")
+ */
+export function formatInteger(value: number): string {
+  return integerFormat.format(value)
+}
+
 /**
  * Format a number with comma separators or abbreviations for large values
  */
@@ -22,9 +34,13 @@ export function formatNumber(value: number): string {
   }
 
   // For smaller numbers, use comma separators
-  return value.toLocaleString('en-US')
+  return integerFormat.format(value)
 }
 
+// Size units and their byte multipliers (powers of 1024), built once
+const SIZE_UNITS = ['B', 'KB', 'MB', 'GB', 'TB']
+const SIZE_UNIT_BYTES = SIZE_UNITS.map((_, i) => 2 ** (10 * i))
+
 /**
  * Format bytes into human-readable data size (B, KB, MB, GB, TB)
  */
@@ -33,15 +49,20 @@ export function formatDataSize(bytes: number): string {
     return '0 B'
   }
 
-  const sizes = ['B', 'KB', 'MB', 'GB', 'TB']
-  const k = 1024
-  const i = Math.floor(Math.log(Math.abs(bytes)) / Math.log(k))
+  // Walk the precomputed multipliers to the largest unit that fits; this
+  // avoids two logarithms and a Math.pow() per call, and sizes beyond TB stay
+  // in TB rather than indexing past the end of the unit list
+  const magnitude = Math.abs(bytes)
+  let i = 0
+  while (i < SIZE_UNITS.length - 1 && magnitude >= SIZE_UNIT_BYTES[i + 1]) {
+    i++
+  }
 
   if (i === 0) {
     return `${bytes} B`
   }
 
-  return `${(bytes / Math.pow(k, i)).toFixed(2)} ${sizes[i]}`
+  return `${(bytes / SIZE_UNIT_BYTES[i]).toFixed(2)} ${SIZE_UNITS[i]}`
 }
 
 /**
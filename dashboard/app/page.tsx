@@ -1,6 +1,7 @@
 'use client'
 
 import { useEffect, useCallback, useState } from 'react'
+import dynamic from 'next/dynamic'
 import { useCollectorStatus } from './hooks/useCollectorStatus'
 import { useBlockchainData } from './hooks/useBlockchainData'
 import {
@@ -13,10 +14,26 @@ import StatusCard from './components/StatusCard'
 import ControlButtons from './components/ControlButtons'
 import CountdownTimer from './components/CountdownTimer'
 import MetricsGrid from './components/MetricsGrid'
-import BlockchainChart from './components/BlockchainChart'
 import DataTable from './components/DataTable'
 import PreviewTable from './components/PreviewTable'
 
+// Recharts is by far the largest dependency of the page. Loading the chart as a
+// separate chunk lets the rest of the dashboard (status, controls, metrics)
+// render without waiting for it to download and parse.
+const BlockchainChart = dynamic(() => import('./components/BlockchainChart'), {
+  ssr: false,
+  loading: () => (
+    <div className="bg-white rounded-lg shadow p-6 border border-gray-200 min-h-[394px] flex items-center justify-center">
+      <div className="text-gray-500">Loading chart...</div>
+    </div>
+  ),
+})
+
+// Limits from the build-time environment, parsed once rather than on every render
+// Max collection time falls back to 10 minutes
+const MAX_COLLECTION_TIME_MINUTES = parseInt(process.env.NEXT_PUBLIC_MAX_COLLECTION_TIME_MINUTES || '10')
+const MAX_DATA_SIZE_GB = parseInt(process.env.NEXT_PUBLIC_MAX_DATA_SIZE_GB || '5')
+
 export default function DashboardPage() {
   const { status, isLoading: statusLoading, isError: statusError, mutate: refreshStatus } = useCollectorStatus()
   const { data, isLoading: dataLoading, isError: dataError } = useBlockchainData()
@@ -30,9 +47,8 @@ export default function DashboardPage() {
   // State for auto-stop notification
   const [autoStopMessage, setAutoStopMessage] = useState<string | null>(null)
 
-  // Get max collection time from environment (fallback to 10 minutes)
-  const maxMinutes = parseInt(process.env.NEXT_PUBLIC_MAX_COLLECTION_TIME_MINUTES || '10')
-  const maxSizeGB = parseInt(process.env.NEXT_PUBLIC_MAX_DATA_SIZE_GB || '5')
+  const maxMinutes = MAX_COLLECTION_TIME_MINUTES
+  const maxSizeGB = MAX_DATA_SIZE_GB
 
   const handleStart = useCallback(async () => {
     const res = await fetch('/api/start', { method: 'POST' })
@@ -72,14 +88,11 @@ export default function DashboardPage() {
 
   // Auto-stop when timer expires
   useEffect(() => {
-    if (!status?.is_running || !status?.started_at) return
+    const startedAtEpoch = status?.started_at_epoch ?? null
+    if (!status?.is_running || startedAtEpoch === null) return
 
     const checkTimer = () => {
-      if (!status.started_at) return
-
-      const started = new Date(status.started_at).getTime()
-      const now = Date.now()
-      const elapsedMinutes = (now - started) / (1000 * 60)
+      const elapsedMinutes = (Date.now() / 1000 - startedAtEpoch) / 60
 
       // VALIDATION: Only auto-stop if timestamp is valid and recent
       const isValidTimestamp = elapsedMinutes >= 0 && elapsedMinutes <= maxMinutes * 2
@@ -102,7 +115,7 @@ export default function DashboardPage() {
     const interval = setInterval(checkTimer, 1000)
 
     return () => clearInterval(interval)
-  }, [status?.is_running, status?.started_at, maxMinutes, handleStop])
+  }, [status?.is_running, status?.started_at_epoch, maxMinutes, handleStop])
 
   if (statusLoading || dataLoading) {
     return (
@@ -143,7 +156,7 @@ export default function DashboardPage() {
         <div className="grid grid-cols-1 md:grid-cols-3 gap-6 items-center">
           <StatusCard isRunning={status?.is_running || false} />
           <CountdownTimer
-            startedAt={status?.started_at || null}
+            startedAtEpoch={status?.started_at_epoch ?? null}
             isRunning={status?.is_running || false}
             maxMinutes={maxMinutes}
           />
@@ -177,6 +190,15 @@ export default function DashboardPage() {
         </div>
       )}
 
+      {/* Stale Data Notice */}
+      {data?.stale && (
+        <div className="bg-yellow-50 border border-yellow-200 rounded-lg p-4 mb-6">
+          <p className="text-yellow-800 text-sm">
+            Database temporarily unreachable - showing the last known record counts.
+          </p>
+        </div>
+      )}
+
       {/* Metrics Grid */}
       <div className="mb-6">
         <MetricsGrid